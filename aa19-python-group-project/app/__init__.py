@@ -4,15 +4,20 @@ from flask_cors import CORS
 from flask_migrate import Migrate
 from flask_wtf.csrf import CSRFProtect, generate_csrf
 from flask_login import LoginManager
-from .models import db, User
+from .models import db, user_cache
 from .api.user_routes import user_routes
 from .api.auth_routes import auth_routes
 from .api.pokemon_routes import pokemon_routes
 from .api.review_routes import review_routes
 from .api.list_routes import list_routes
 from .api.image_routes import image_routes
+from .api.search_routes import search_routes
+from .api.export_routes import export_routes
 from .seeds import seed_commands
+from .commands import ratings_commands, export, import_catalog, assets_commands, replica_commands
 from .config import Config
+from . import engine_profiles, instrumentation, metrics, replicas, static_files
+from .json_provider import provider_class
 
 app = Flask(__name__, static_folder='../react-vite/dist', static_url_path='/')
 
@@ -23,21 +28,38 @@ login.login_view = 'auth.unauthorized'
 
 @login.user_loader
 def load_user(id):
-    return User.query.get(int(id))
+    # Served from an in-process cache, see app/models/user_cache.py
+    return user_cache.load(int(id))
 
 
 # Tell flask about our seed commands
 app.cli.add_command(seed_commands)
+app.cli.add_command(ratings_commands)
+app.cli.add_command(export)
+app.cli.add_command(import_catalog)
+app.cli.add_command(assets_commands)
+app.cli.add_command(replica_commands)
 
 app.config.from_object(Config)
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_profiles.engine_options(app.config)
+app.config['SQLALCHEMY_BINDS'] = replicas.binds(app.config, app.config['SQLALCHEMY_ENGINE_OPTIONS'])
+app.json = provider_class(app.config['JSON_PROVIDER'])(app)
+user_cache.configure(app.config['USER_CACHE_SIZE'], app.config['USER_CACHE_TTL'])
 app.register_blueprint(user_routes, url_prefix='/api/users')
 app.register_blueprint(auth_routes, url_prefix='/api/auth')
 app.register_blueprint(pokemon_routes, url_prefix='/api/pokemon')
 app.register_blueprint(review_routes, url_prefix='/api/reviews')
 app.register_blueprint(list_routes, url_prefix='/api/lists')
 app.register_blueprint(image_routes, url_prefix='/api/images')
+app.register_blueprint(search_routes, url_prefix='/api/search')
+app.register_blueprint(export_routes, url_prefix='/api/export')
 db.init_app(app)
+engine_profiles.init_app(app, db)
+replicas.init_app(app, db)
 Migrate(app, db)
+instrumentation.init_app(app)
+metrics.init_app(app, db)
+static_files.init_app(app)
 
 # Application Security - Updated for better CORS handling
 CORS(app, 
@@ -62,6 +84,10 @@ def https_redirect():
 
 @app.after_request
 def inject_csrf_token(response):
+    # Only API responses need the cookie. Leaving it off static files keeps
+    # them cacheable and skips generating a token for every asset.
+    if not request.path.startswith('/api/'):
+        return response
     response.set_cookie(
         'csrf_token',
         generate_csrf(),
@@ -93,9 +119,9 @@ def react_root(path):
     """
     if path == 'favicon.ico':
         return app.send_from_directory('public', 'favicon.ico')
-    return app.send_static_file('index.html')
+    return static_files.send_asset('index.html')
 
 
 @app.errorhandler(404)
 def not_found(e):
-    return app.send_static_file('index.html')
+    return static_files.send_asset('index.html')
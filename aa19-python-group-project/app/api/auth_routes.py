@@ -1,12 +1,24 @@
 from flask import Blueprint, request
+from sqlalchemy.exc import IntegrityError
 from app.models import User, db
 from app.forms import LoginForm
-from app.forms import SignUpForm
+from app.forms import SignUpForm, DUPLICATE_ERRORS
 from flask_login import current_user, login_user, logout_user, login_required
 
 auth_routes = Blueprint('auth', __name__)
 
 
+def duplicate_errors(error):
+    """
+    Maps a unique violation on users to the signup form's field errors. The
+    constraint shows up as users.email on SQLite and users_email_key on
+    Postgres.
+    """
+    message = str(error.orig)
+    return {field: [text] for field, text in DUPLICATE_ERRORS.items()
+            if f'users.{field}' in message or f'users_{field}_key' in message}
+
+
 @auth_routes.route('/')
 def authenticate():
     """
@@ -27,8 +39,13 @@ def login():
     # form manually to validate_on_submit can be used
     form['csrf_token'].data = request.cookies['csrf_token']
     if form.validate_on_submit():
+        # Validation already loaded the user
+        user = form.user
+        if user.password_needs_rehash():
+            # The password is only in hand now, upgrade its hash while it is
+            user.password = form.data['password']
+            db.session.commit()
         # Add the user to the session, we are logged in!
-        user = User.query.filter(User.email == form.data['email']).first()
         login_user(user)
         return user.to_dict()
     return form.errors, 401
@@ -57,9 +74,20 @@ def sign_up():
             password=form.data['password']
         )
         db.session.add(user)
-        db.session.commit()
+        try:
+            db.session.flush()
+        except IntegrityError as e:
+            db.session.rollback()
+            errors = duplicate_errors(e)
+            if not errors:
+                raise
+            return errors, 401
+        # Log in and serialize before the commit expires the new row, which
+        # would cost a SELECT to reload it
         login_user(user)
-        return user.to_dict()
+        body = user.to_dict()
+        db.session.commit()
+        return body
     return form.errors, 401
 
 
@@ -0,0 +1,37 @@
+from flask import request
+from .pagination import bad_request
+
+MAX_BATCH_IDS = 250
+
+
+def requested_ids():
+    """
+    Reads ?ids=1,2,3 and returns the ids in request order with duplicates
+    dropped. Missing, non-numeric or more than MAX_BATCH_IDS ids answer 400
+    with the usual errors payload.
+    """
+    raw = [value.strip() for value in request.args.get('ids', '').split(',') if value.strip()]
+    error = None
+    if not raw:
+        error = 'Pass one or more comma separated ids'
+    elif not all(value.isdigit() for value in raw):
+        error = 'Ids must be whole numbers'
+    else:
+        ids = list(dict.fromkeys(int(value) for value in raw))
+        if len(ids) > MAX_BATCH_IDS:
+            error = f'At most {MAX_BATCH_IDS} ids per request'
+    if error:
+        bad_request('ids', error)
+    return ids
+
+
+def batch_response(name, ids, rows, items):
+    """
+    Puts the serialized items back in the order of ids and lists the ids
+    that matched no row. rows and items line up, as from serialize_all().
+    """
+    by_id = {row.id: item for row, item in zip(rows, items)}
+    return {
+        name: [by_id[id] for id in ids if id in by_id],
+        'missing': [id for id in ids if id not in by_id],
+    }
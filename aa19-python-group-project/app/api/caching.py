@@ -0,0 +1,44 @@
+from datetime import datetime, timezone
+from functools import wraps
+from hashlib import sha1
+from flask import request, make_response
+from app.models import TableVersion
+
+
+def conditional(*tables):
+    """
+    Adds ETag / Last-Modified validators built from the version counters of
+    the tables a route reads. A request whose validators still match gets a
+    304 straight away, without running the view or loading any models.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            versions = TableVersion.current(tables)
+            stamp = ','.join(f'{table}:{versions[table][0]}' for table in tables)
+            etag = sha1(f'{request.full_path}|{stamp}'.encode()).hexdigest()
+            last_modified = max(updated_at for version, updated_at in versions.values())
+            last_modified = last_modified.replace(microsecond=0, tzinfo=timezone.utc)
+            known = last_modified > datetime.min.replace(tzinfo=timezone.utc)
+
+            if request.if_none_match:
+                fresh = request.if_none_match.contains(etag)
+            else:
+                fresh = bool(known and request.if_modified_since
+                             and request.if_modified_since >= last_modified)
+
+            if fresh:
+                response = make_response('', 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag)
+            if known:
+                response.last_modified = last_modified
+            # Let clients keep the body but revalidate on every use
+            response.cache_control.no_cache = True
+            return response
+        return wrapper
+    return decorator
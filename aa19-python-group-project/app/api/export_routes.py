@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+from flask_login import login_required
+from app.models.export import EXPORTS, export_ndjson
+
+export_routes = Blueprint('export', __name__)
+
+
+def parse_timestamp(value):
+    """
+    An ISO 8601 date or datetime as a naive UTC datetime, like updated_at is
+    stored. A trailing Z is accepted on every Python version (fromisoformat
+    only takes it from 3.11) and UTC offsets are converted. Raises ValueError
+    for anything else.
+    """
+    if value[-1:] in ('Z', 'z'):
+        value = value[:-1] + '+00:00'
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+@export_routes.route('/<name>')
+@login_required
+def export_table(name):
+    """
+    Streams every Pokemon, review or image as newline-delimited JSON.
+    Takes ?updated_since= (ISO 8601) to export only rows changed since then.
+    """
+    if name not in EXPORTS:
+        return jsonify({'errors': {'name': f"Exports are {', '.join(EXPORTS)}"}}), 404
+
+    updated_since = request.args.get('updated_since')
+    if updated_since:
+        try:
+            updated_since = parse_timestamp(updated_since)
+        except ValueError:
+            return jsonify({'errors': {'updated_since': (
+                f'{updated_since!r} is not an ISO 8601 date or datetime, e.g. 2024-05-01 '
+                'or 2024-05-01T12:00:00Z. Send the + of an offset as %2B.')}}), 400
+
+    # stream_with_context keeps the request (and its database session) alive
+    # until the last chunk is sent
+    chunks = stream_with_context(export_ndjson(name, updated_since or None))
+    return Response(chunks, mimetype='application/x-ndjson', headers={
+        'Content-Disposition': f'attachment; filename={name}.ndjson'
+    })
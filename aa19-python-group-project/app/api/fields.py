@@ -0,0 +1,16 @@
+from flask import request
+from .pagination import bad_request
+
+
+def requested_fields(model):
+    """
+    Reads ?view=summary|full and ?fields=a,b,c for model and returns the
+    field names to load and serialize. Unknown names answer 400 with the
+    usual errors payload.
+    """
+    fields = [field.strip() for field in request.args.get('fields', '').split(',')
+              if field.strip()]
+    try:
+        return model.resolve_fields(request.args.get('view'), fields)
+    except ValueError as e:
+        bad_request('fields', str(e))
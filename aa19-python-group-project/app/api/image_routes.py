@@ -2,20 +2,37 @@ from flask import Blueprint, jsonify, request
 from flask_login import login_required, current_user
 from app.models import db, Image, Pokemon
 from app.forms import ImageForm
+from .pagination import paginate, page_response
+from .caching import conditional
+from .batch import requested_ids, batch_response
 
 image_routes = Blueprint('images', __name__)
 
 @image_routes.route('/')
+@conditional('images')
 def get_all_images():
-    images = Image.query.all()
-    return jsonify({'images': [i.to_dict() for i in images]})
+    images, next_cursor = paginate(Image.query, Image.id)
+    return jsonify(page_response('images', [i.to_dict() for i in images], next_cursor))
+
+@image_routes.route('/batch')
+@conditional('images')
+def get_images_batch():
+    """
+    Fetches the images in ?ids= with one IN query, in the order of ids.
+    Ids with no image are listed in missing.
+    """
+    ids = requested_ids()
+    images = Image.query.filter(Image.id.in_(ids)).all()
+    return jsonify(batch_response('images', ids, images, [i.to_dict() for i in images]))
 
 @image_routes.route('/<int:id>')
+@conditional('images')
 def get_image_by_id(id):
     image = Image.query.get_or_404(id)
     return jsonify(image.to_dict())
 
 @image_routes.route('/pokemon/<int:pokemon_id>')
+@conditional('pokemon', 'images')
 def get_pokemon_images(pokemon_id):
     pokemon = Pokemon.query.get_or_404(pokemon_id)
     images = Image.query.filter_by(pokemon_id=pokemon_id).all()
@@ -32,7 +49,6 @@ def upload_pokemon_image(pokemon_id):
     if form.validate_on_submit():
         image = Image(
             url=form.data['url'],
-            caption=form.data['caption'],
             pokemon_id=pokemon_id,
             user_id=current_user.id
         )
@@ -57,7 +73,6 @@ def update_image(id):
     
     if form.validate_on_submit():
         image.url = form.data['url']
-        image.caption = form.data['caption']
         
         db.session.commit()
         return jsonify(image.to_dict())
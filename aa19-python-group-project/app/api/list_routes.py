@@ -1,14 +1,21 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, jsonify, request, abort
 from flask_login import login_required, current_user
-from app.models import db, List, ListPokemon, Pokemon
+from app.models import db, List, ListPokemon
 from app.forms import ListForm
+from .pagination import paginate, page_response
+from .fields import requested_fields
+from .caching import conditional
 
 list_routes = Blueprint('lists', __name__)
 
+MAX_BULK_IDS = 500
+
 @list_routes.route('/')
+@conditional('lists', 'list_pokemon')
 def get_all_lists():
-    lists = List.query.all()
-    return jsonify({'lists': [l.to_dict() for l in lists]})
+    fields = requested_fields(List)
+    lists, next_cursor = paginate(List.collection_query(fields), List.id)
+    return jsonify(page_response('lists', List.serialize_all(lists, fields), next_cursor))
 
 @list_routes.route('/', methods=['POST'])
 @login_required
@@ -30,9 +37,11 @@ def create_list():
     return jsonify({'errors': form.errors}), 400
 
 @list_routes.route('/<int:id>')
+@conditional('lists', 'list_pokemon')
 def get_list_by_id(id):
-    list_item = List.query.get_or_404(id)
-    return jsonify(list_item.to_dict())
+    fields = requested_fields(List)
+    list_item = List.query.options(*List.load_options(fields)).get_or_404(id)
+    return jsonify(list_item.to_dict(fields))
 
 @list_routes.route('/<int:id>', methods=['PATCH'])
 @login_required
@@ -74,21 +83,12 @@ def add_pokemon_to_list(list_id, pokemon_id):
     if list_item.user_id != current_user.id:
         return jsonify({'error': 'Unauthorized'}), 403
     
-    pokemon = Pokemon.query.get_or_404(pokemon_id)
-    
-    existing = ListPokemon.query.filter_by(
-        list_id=list_id, pokemon_id=pokemon_id
-    ).first()
-    
-    if existing:
+    status = ListPokemon.add_many(list_id, [pokemon_id])[pokemon_id]
+    if status == 'not_found':
+        abort(404)
+    if status == 'already_in_list':
         return jsonify({'error': 'Pokemon already in list'}), 400
     
-    list_pokemon = ListPokemon(
-        list_id=list_id,
-        pokemon_id=pokemon_id
-    )
-    
-    db.session.add(list_pokemon)
     db.session.commit()
     
     return jsonify({'message': 'Pokemon added to list'}), 201
@@ -109,3 +109,34 @@ def remove_pokemon_from_list(list_id, pokemon_id):
     db.session.commit()
     
     return jsonify({'message': 'Pokemon removed from list'})
+
+@list_routes.route('/<int:list_id>/pokemon', methods=['POST', 'DELETE'])
+@login_required
+def bulk_update_list_pokemon(list_id):
+    """
+    Adds (POST) or removes (DELETE) every Pokemon in the JSON body's
+    pokemon_ids in one statement and one transaction, reporting the outcome
+    for each id
+    """
+    list_item = List.query.get_or_404(list_id)
+    
+    if list_item.user_id != current_user.id:
+        return jsonify({'error': 'Unauthorized'}), 403
+    
+    pokemon_ids = (request.get_json(silent=True) or {}).get('pokemon_ids')
+    if (not isinstance(pokemon_ids, list) or not pokemon_ids
+            or not all(isinstance(id, int) and not isinstance(id, bool) for id in pokemon_ids)):
+        return jsonify({'errors': {'pokemon_ids': 'Provide a list of Pokemon ids'}}), 400
+    if len(pokemon_ids) > MAX_BULK_IDS:
+        return jsonify({'errors': {'pokemon_ids': f'At most {MAX_BULK_IDS} ids per request'}}), 400
+    
+    if request.method == 'POST':
+        outcomes = ListPokemon.add_many(list_id, pokemon_ids)
+    else:
+        outcomes = ListPokemon.remove_many(list_id, pokemon_ids)
+    db.session.commit()
+    
+    return jsonify({
+        'list_id': list_id,
+        'results': [{'pokemon_id': id, 'status': status} for id, status in outcomes.items()]
+    })
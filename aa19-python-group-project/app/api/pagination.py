@@ -0,0 +1,86 @@
+from flask import current_app, request, jsonify, make_response, abort
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+
+def wants_all():
+    """
+    Whether to answer with every row, in the shape from before pagination.
+    ?all=true asks for it. Until PAGINATE_BY_DEFAULT is turned on, so does a
+    request with neither ?limit= nor ?after=, as the deployed client sends.
+    """
+    if 'all' in request.args:
+        return request.args['all'].lower() in ('1', 'true', 'yes')
+    if current_app.config['PAGINATE_BY_DEFAULT']:
+        return False
+    return 'limit' not in request.args and 'after' not in request.args
+
+
+def bad_request(name, message):
+    """
+    Ends the request with a 400 and the usual {'errors': {name: message}}
+    """
+    abort(make_response(jsonify({'errors': {name: message}}), 400))
+
+
+def int_arg(name, default=None):
+    """
+    An integer query argument, or default when it is missing. Anything
+    else answers 400 with the usual errors payload.
+    """
+    value = request.args.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        bad_request(name, f'{name.capitalize()} must be a whole number')
+
+
+def page_limit():
+    """
+    The requested ?limit=, capped at MAX_LIMIT. A limit below 1 is a 400.
+    """
+    limit = int_arg('limit', DEFAULT_LIMIT)
+    if limit < 1:
+        bad_request('limit', 'Limit must be at least 1')
+    return min(limit, MAX_LIMIT)
+
+
+def paginate(query, key):
+    """
+    Keyset pagination on an indexed, unique column (usually the primary key).
+
+    Reads ?limit= and ?after= from the request and returns the rows for one
+    page plus the cursor for the next page, or None on the last page. A
+    malformed limit or cursor answers 400. Seeking past the cursor with
+    WHERE key > after keeps deep pages as cheap as the first one, where
+    OFFSET would scan every row before them.
+    """
+    query = query.order_by(key)
+    if wants_all():
+        return query.all(), None
+
+    limit = page_limit()
+    after = int_arg('after')
+    if after is not None:
+        query = query.filter(key > after)
+
+    # Fetch one extra row to learn whether another page exists
+    rows = query.limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, getattr(rows[-1], key.key)
+    return rows, None
+
+
+def page_response(name, items, next_cursor):
+    """
+    Builds the collection payload, leaving out next_cursor for ?all=true so
+    those clients get exactly the old shape
+    """
+    body = {name: items}
+    if not wants_all():
+        body['next_cursor'] = next_cursor
+    return body
@@ -1,14 +1,82 @@
+import io
 from flask import Blueprint, jsonify, request
 from flask_login import login_required, current_user
-from app.models import db, Pokemon, Image
+from app.models import db, Pokemon, Image, Review, User
 from app.forms import PokemonForm
+from app.models.catalog_import import FORMATS, read_rows, import_pokemon
+from .pagination import paginate, page_response
+from .fields import requested_fields
+from .batch import requested_ids, batch_response
+from .caching import conditional
 
 pokemon_routes = Blueprint('pokemon', __name__)
 
+
+# What the detail page shows of the Pokemon itself, its reviews and images
+# come from their own queries
+DETAIL_FIELDS = Pokemon.COLUMN_FIELDS + ('rating_histogram',)
+
+
+def pokemon_query(fields=None):
+    # Load only the columns and relationships the response serializes; each
+    # requested relationship comes in with one IN query for the whole result
+    # instead of one query per row
+    return Pokemon.query.options(*Pokemon.load_options(fields))
+
+
+def filter_pokemon(query):
+    """
+    Applies the ?type=, ?type_secondary=, ?region=, ?category= and
+    ?min_rating= filters in SQL. Text filters are case-insensitive and
+    line up with the lower() expression indexes on those columns.
+    """
+    for facet in Pokemon.FACETS:
+        value = request.args.get(facet)
+        if value:
+            query = query.filter(db.func.lower(getattr(Pokemon, facet)) == value.lower())
+    min_rating = request.args.get('min_rating', type=float)
+    if min_rating is not None:
+        query = query.filter(Pokemon.average_rating >= min_rating)
+    return query
+
+
 @pokemon_routes.route('/')
+@conditional('pokemon', 'reviews', 'images', 'list_pokemon')
 def get_all_pokemon():
-    pokemon = Pokemon.query.all()
-    return jsonify({'pokemon': [p.to_dict() for p in pokemon]})
+    fields = requested_fields(Pokemon)
+    pokemon, next_cursor = paginate(filter_pokemon(Pokemon.collection_query(fields)), Pokemon.id)
+    return jsonify(page_response('pokemon', Pokemon.serialize_all(pokemon, fields), next_cursor))
+
+@pokemon_routes.route('/batch')
+@conditional('pokemon', 'reviews', 'images', 'list_pokemon')
+def get_pokemon_batch():
+    """
+    Fetches the Pokemon in ?ids= (up to MAX_BATCH_IDS) with one IN query,
+    plus one per requested relationship, honouring ?view= and ?fields=.
+    Results keep the order of ids; ids with no Pokemon are listed in missing.
+    """
+    ids = requested_ids()
+    fields = requested_fields(Pokemon)
+    pokemon = Pokemon.collection_query(fields).filter(Pokemon.id.in_(ids)).all()
+    return jsonify(batch_response('pokemon', ids, pokemon, Pokemon.serialize_all(pokemon, fields)))
+
+@pokemon_routes.route('/facets')
+@conditional('pokemon')
+def get_pokemon_facets():
+    """
+    Counts the Pokemon matching the current filters per type,
+    type_secondary, region and category
+    """
+    columns = [getattr(Pokemon, facet) for facet in Pokemon.FACETS]
+    # One GROUP BY pass over the facet combinations, folded per facet here
+    rows = filter_pokemon(db.session.query(*columns, db.func.count(Pokemon.id))).group_by(*columns)
+    facets = {facet: {} for facet in Pokemon.FACETS}
+    for row in rows:
+        count = row[-1]
+        for facet, value in zip(Pokemon.FACETS, row):
+            if value is not None:
+                facets[facet][value] = facets[facet].get(value, 0) + count
+    return jsonify({'facets': facets})
 
 @pokemon_routes.route('/', methods=['POST'])
 @login_required
@@ -44,10 +112,54 @@ def create_pokemon():
     
     return jsonify({'errors': form.errors}), 400
 
+@pokemon_routes.route('/import', methods=['POST'])
+@login_required
+def import_pokemon_catalog():
+    """
+    Creates Pokemon in bulk from an NDJSON or CSV request body (pick with
+    ?format= or the Content-Type), one PokemonForm-shaped record per line.
+    Valid rows are saved in batches; invalid ones come back with their errors.
+    """
+    format = request.args.get('format') or ('csv' if request.mimetype == 'text/csv' else 'ndjson')
+    if format not in FORMATS:
+        return jsonify({'errors': {'format': f"Use one of {', '.join(FORMATS)}"}}), 400
+
+    # Read the body as a stream, so large catalogs are never held in memory
+    stream = io.TextIOWrapper(request.stream, encoding='utf-8', newline='')
+    created, errors = import_pokemon(read_rows(stream, format), current_user.id)
+    return jsonify({'created': created, 'errors': errors}), 201 if created else 200
+
 @pokemon_routes.route('/<int:id>')
+@conditional('pokemon', 'reviews', 'images', 'list_pokemon')
 def get_pokemon_by_id(id):
-    pokemon = Pokemon.query.get_or_404(id)
-    return jsonify(pokemon.to_dict())
+    fields = requested_fields(Pokemon)
+    pokemon = pokemon_query(fields).get_or_404(id)
+    return jsonify(pokemon.to_dict(fields))
+
+@pokemon_routes.route('/<int:id>/detail')
+@conditional('pokemon', 'reviews', 'images', 'users')
+def get_pokemon_detail(id):
+    """
+    Everything the detail page shows, in the same four queries however many
+    reviews there are: the Pokemon with its rating aggregates, one page of
+    its reviews with each reviewer's username, and its images. Reviews page
+    with ?limit= and ?after= like the other collections; pass next_cursor
+    as ?after= to load more.
+    """
+    pokemon = pokemon_query(DETAIL_FIELDS).get_or_404(id)
+
+    review_fields = Review.VIEWS['full']
+    reviews = (Review.query.join(Review.user)
+               .with_entities(*[getattr(Review, field) for field in review_fields], User.username)
+               .filter(Review.pokemon_id == id))
+    reviews, next_cursor = paginate(reviews, Review.id)
+    images = Image.query.filter_by(pokemon_id=id).order_by(Image.id).all()
+
+    detail = pokemon.to_dict(DETAIL_FIELDS)
+    detail['reviews'] = [dict(zip(review_fields + ('username',), row)) for row in reviews]
+    detail['next_cursor'] = next_cursor
+    detail['images'] = [image.to_dict() for image in images]
+    return jsonify(detail)
 
 @pokemon_routes.route('/<int:id>', methods=['PATCH'])
 @login_required
@@ -81,11 +193,8 @@ def delete_pokemon(id):
     if pokemon.user_id != current_user.id:
         return jsonify({'error': 'Unauthorized'}), 403
     
-    # Delete associated images (only database records, not files)
-    images = Image.query.filter_by(pokemon_id=id).all()
-    for image in images:
-        db.session.delete(image)
-    
+    # Reviews, images and list entries go with it through ON DELETE CASCADE
+    # (only database records, not image files)
     db.session.delete(pokemon)
     db.session.commit()
     return jsonify({'message': 'Pokemon deleted successfully'})
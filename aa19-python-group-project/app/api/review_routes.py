@@ -1,18 +1,42 @@
 from flask import Blueprint, jsonify, request
 from flask_login import login_required, current_user
-from app.models import db, Review
+from app.models import db, Review, Pokemon
 from app.forms import ReviewForm
+from .pagination import paginate, page_response
+from .fields import requested_fields
+from .batch import requested_ids, batch_response
+from .caching import conditional
 
 review_routes = Blueprint('reviews', __name__)
 
 @review_routes.route('/pokemon/<int:pokemon_id>/reviews')
+@conditional('reviews')
 def get_pokemon_reviews(pokemon_id):
-    reviews = Review.query.filter_by(pokemon_id=pokemon_id).all()
-    return jsonify({'reviews': [r.to_dict() for r in reviews]})
+    fields = requested_fields(Review)
+    query = Review.collection_query(fields).filter(Review.pokemon_id == pokemon_id)
+    reviews, next_cursor = paginate(query, Review.id)
+    return jsonify(page_response('reviews', Review.serialize_all(reviews, fields), next_cursor))
+
+@review_routes.route('/batch')
+@conditional('reviews')
+def get_reviews_batch():
+    """
+    Fetches the reviews in ?ids= with one IN query, in the order of ids,
+    honouring ?view= and ?fields=. Ids with no review are listed in missing.
+    """
+    ids = requested_ids()
+    fields = requested_fields(Review)
+    reviews = Review.collection_query(fields).filter(Review.id.in_(ids)).all()
+    return jsonify(batch_response('reviews', ids, reviews, Review.serialize_all(reviews, fields)))
 
 @review_routes.route('/pokemon/<int:pokemon_id>/reviews', methods=['POST'])
 @login_required
 def create_pokemon_review(pokemon_id):
+    # Checked up front, adjust_ratings autoflushes the review and a missing
+    # Pokemon would fail its foreign key with a 500
+    if not db.session.query(db.exists().where(Pokemon.id == pokemon_id)).scalar():
+        return jsonify({'errors': {'pokemon_id': 'Pokemon not found'}}), 404
+
     form = ReviewForm()
     form['csrf_token'].data = request.cookies['csrf_token']
     
@@ -26,15 +50,18 @@ def create_pokemon_review(pokemon_id):
         )
         
         db.session.add(review)
+        Pokemon.adjust_ratings(pokemon_id, added=review.rating)
         db.session.commit()
         return jsonify(review.to_dict()), 201
     
     return jsonify({'errors': form.errors}), 400
 
 @review_routes.route('/<int:id>')
+@conditional('reviews')
 def get_review_by_id(id):
-    review = Review.query.get_or_404(id)
-    return jsonify(review.to_dict())
+    fields = requested_fields(Review)
+    review = Review.query.options(*Review.load_options(fields)).get_or_404(id)
+    return jsonify(review.to_dict(fields))
 
 @review_routes.route('/<int:id>', methods=['PATCH'])
 @login_required
@@ -48,6 +75,8 @@ def update_review(id):
     form['csrf_token'].data = request.cookies['csrf_token']
     
     if form.validate_on_submit():
+        if review.rating != form.data['rating']:
+            Pokemon.adjust_ratings(review.pokemon_id, added=form.data['rating'], removed=review.rating)
         review.rating = form.data['rating']
         review.title = form.data['title']
         review.body = form.data['body']
@@ -65,6 +94,7 @@ def delete_review(id):
     if review.user_id != current_user.id:
         return jsonify({'error': 'Unauthorized'}), 403
     
+    Pokemon.adjust_ratings(review.pokemon_id, removed=review.rating)
     db.session.delete(review)
     db.session.commit()
     return jsonify({'message': 'Review deleted successfully'})
@@ -0,0 +1,51 @@
+from flask import Blueprint, jsonify, request
+from app.models import Pokemon, Review
+from app.models.search import search_catalog
+from .pagination import page_limit
+from .caching import conditional
+
+search_routes = Blueprint('search', __name__)
+
+
+@search_routes.route('')
+@conditional('pokemon', 'reviews', 'images')
+def search():
+    """
+    Ranked full text search over Pokemon and reviews. Takes ?q=, ?limit= and
+    ?offset=, where offset is the next_offset of the previous page.
+
+    Unlike the keyset cursors of the other list endpoints this is a plain
+    OFFSET: ranks are computed per query and shift as the index changes, so
+    there is no stable key to resume from. Deep pages cost more, and rows
+    can repeat or be skipped between pages when the catalog changes.
+    """
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({'errors': {'q': 'A search query is required'}}), 400
+
+    limit = page_limit()
+    offset = request.args.get('offset', '0')
+    if not offset.isdigit():
+        return jsonify({'errors': {'offset': 'Offset must be a whole number'}}), 400
+    offset = int(offset)
+    hits = search_catalog(query, limit + 1, offset)
+    next_offset = offset + limit if len(hits) > limit else None
+    hits = hits[:limit]
+
+    # Hydrate each kind with one IN query, using the summary projections
+    pokemon_fields = Pokemon.VIEWS['summary']
+    review_fields = Review.VIEWS['summary']
+    pokemon_ids = [id for kind, id, rank in hits if kind == 'pokemon']
+    review_ids = [id for kind, id, rank in hits if kind == 'review']
+    pokemon = {p.id: p for p in Pokemon.query.options(*Pokemon.load_options(pokemon_fields))
+               .filter(Pokemon.id.in_(pokemon_ids))} if pokemon_ids else {}
+    reviews = {r.id: r for r in Review.query.options(*Review.load_options(review_fields))
+               .filter(Review.id.in_(review_ids))} if review_ids else {}
+
+    results = []
+    for kind, id, rank in hits:
+        if kind == 'pokemon' and id in pokemon:
+            results.append({'type': kind, 'rank': rank, 'pokemon': pokemon[id].to_dict(pokemon_fields)})
+        elif kind == 'review' and id in reviews:
+            results.append({'type': kind, 'rank': rank, 'review': reviews[id].to_dict(review_fields)})
+    return jsonify({'results': results, 'next_offset': next_offset})
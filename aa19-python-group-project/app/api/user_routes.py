@@ -1,6 +1,7 @@
 from flask import Blueprint, jsonify
 from flask_login import login_required
 from app.models import User
+from .pagination import paginate, page_response
 
 user_routes = Blueprint('users', __name__)
 
@@ -9,10 +10,10 @@ user_routes = Blueprint('users', __name__)
 @login_required
 def users():
     """
-    Query for all users and returns them in a list of user dictionaries
+    Query for a page of users and returns them in a list of user dictionaries
     """
-    users = User.query.all()
-    return {'users': [user.to_dict() for user in users]}
+    users, next_cursor = paginate(User.query, User.id)
+    return page_response('users', [user.to_dict() for user in users], next_cursor)
 
 
 @user_routes.route('/<int:id>')
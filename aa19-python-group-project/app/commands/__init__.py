@@ -0,0 +1,5 @@
+from .ratings import ratings_commands
+from .export import export
+from .catalog_import import import_catalog
+from .assets import assets_commands
+from .replicas import replica_commands
@@ -0,0 +1,44 @@
+import gzip
+import os
+from flask import current_app
+from flask.cli import AppGroup
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+# Creates an assets group so we can type `flask assets --help`
+assets_commands = AppGroup('assets')
+
+COMPRESSIBLE = ('.html', '.js', '.css', '.svg', '.json', '.txt', '.map', '.ico')
+# Below this, compression saves less than the extra headers cost
+MIN_SIZE = 1024
+
+
+# Creates the `flask assets compress` command, run it after every build
+@assets_commands.command('compress')
+def compress():
+    """
+    Writes .gz (and .br when the brotli package is installed) next to each
+    compressible file in the React build, for app/static_files.py to serve
+    """
+    written = 0
+    for root, _, files in os.walk(current_app.static_folder):
+        for name in files:
+            path = os.path.join(root, name)
+            if not name.endswith(COMPRESSIBLE) or os.path.getsize(path) < MIN_SIZE:
+                continue
+            with open(path, 'rb') as f:
+                data = f.read()
+            variants = [('.gz', gzip.compress(data, compresslevel=9, mtime=0))]
+            if brotli is not None:
+                variants.append(('.br', brotli.compress(data)))
+            for suffix, compressed in variants:
+                if len(compressed) < len(data):
+                    with open(path + suffix, 'wb') as f:
+                        f.write(compressed)
+                    written += 1
+    if brotli is None:
+        print("brotli is not installed, only .gz files were written")
+    print(f"✅ Wrote {written} precompressed assets")
@@ -0,0 +1,30 @@
+import click
+from flask.cli import with_appcontext
+from app.models import User
+from app.models.catalog_import import FORMATS, read_rows, import_pokemon
+
+
+# Creates the `flask import` command
+@click.command('import')
+@click.argument('file', type=click.File('r', encoding='utf-8'))
+@click.option('--user', 'email', required=True, help='Email of the user the Pokemon are added as.')
+@click.option('--format', type=click.Choice(FORMATS),
+              help='Defaults to csv for .csv files and ndjson otherwise.')
+@click.option('--batch-size', type=click.IntRange(min=1), default=500, show_default=True,
+              help='Rows saved per transaction.')
+@with_appcontext
+def import_catalog(file, email, format, batch_size):
+    """
+    Creates Pokemon (and their images) from an NDJSON or CSV file
+    """
+    user = User.query.filter_by(email=email).first()
+    if user is None:
+        raise click.BadParameter(f'No user with email {email}', param_hint='--user')
+    format = format or ('csv' if file.name.endswith('.csv') else 'ndjson')
+
+    created, errors = import_pokemon(read_rows(file, format), user.id, batch_size)
+    for error in errors:
+        click.echo(f"Row {error['row']}: {error['errors']}", err=True)
+    if errors:
+        raise click.ClickException(f"Imported {created} Pokemon, {len(errors)} rows failed")
+    print(f"✅ Imported {created} Pokemon")
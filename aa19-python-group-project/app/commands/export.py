@@ -0,0 +1,18 @@
+import click
+from flask.cli import with_appcontext
+from app.models.export import EXPORTS, export_ndjson
+
+
+# Creates the `flask export` command
+@click.command('export')
+@click.argument('name', type=click.Choice(list(EXPORTS)))
+@click.option('--updated-since', type=click.DateTime(), help='Only rows updated at or after this time.')
+@click.option('--output', '-o', type=click.File('w'), default='-', help='File to write, stdout by default.')
+@click.option('--chunk-size', default=1000, show_default=True, help='Rows read and written per chunk.')
+@with_appcontext
+def export(name, updated_since, output, chunk_size):
+    """
+    Writes every Pokemon, review or image as newline-delimited JSON
+    """
+    for chunk in export_ndjson(name, updated_since, chunk_size):
+        output.write(chunk)
@@ -0,0 +1,33 @@
+import click
+from flask.cli import AppGroup
+from app.models import db, Pokemon
+
+# Creates a ratings group so we can type `flask ratings --help`
+ratings_commands = AppGroup('ratings')
+
+
+# Creates the `flask ratings rebuild` command
+@ratings_commands.command('rebuild')
+def rebuild():
+    """
+    Recomputes every Pokemon's rating aggregates from the reviews table
+    """
+    updated = Pokemon.rebuild_ratings()
+    db.session.commit()
+    print(f"✅ Rebuilt rating aggregates for {updated} Pokemon")
+
+
+# Creates the `flask ratings check` command
+@ratings_commands.command('check')
+def check():
+    """
+    Reports Pokemon whose stored aggregates drifted from their reviews and
+    exits non-zero if there are any
+    """
+    drift = Pokemon.rating_drift()
+    for pokemon_id, stored, actual in drift:
+        print(f"Pokemon {pokemon_id}: stored count/sum {stored}, actual {actual}")
+    if drift:
+        raise click.ClickException(
+            f"{len(drift)} Pokemon have drifted, run `flask ratings rebuild`")
+    print("✅ Rating aggregates match the reviews table")
@@ -0,0 +1,14 @@
+from flask.cli import AppGroup
+from app import replicas
+
+# Creates a replicas group so we can type `flask replicas --help`
+replica_commands = AppGroup('replicas')
+
+
+# Creates the `flask replicas sync` command, for REPLICA_TEST_MODE
+@replica_commands.command('sync')
+def sync():
+    """
+    Copies the SQLite primary into the SQLite replicas
+    """
+    print(f'Synced {replicas.sync()} replica(s)')
@@ -15,7 +15,57 @@ class Config:
     else:
         # Fallback to SQLite for development
         SQLALCHEMY_DATABASE_URI = 'sqlite:///dev.db'
-    SQLALCHEMY_ECHO = True
+
+    # Engine and connection pool profile, see app/engine_profiles.py
+    DB_PROFILE = os.environ.get('DB_PROFILE', 'auto')
+    # Connections per gunicorn worker, one for each of its threads
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', os.environ.get('GUNICORN_THREADS', 1)))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 2))
+    # Cap on connections across all workers, unset for no cap
+    DB_MAX_CONNECTIONS = int(os.environ.get('DB_MAX_CONNECTIONS', 0))
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 10))
+    DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 1800))
+    # Postgres only, 0 disables
+    DB_STATEMENT_TIMEOUT_MS = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', 30000))
+    SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000))
+    SQLITE_SYNCHRONOUS = os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_MMAP_SIZE = int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))
+    # Negative is KiB, so 64 MiB of page cache per connection
+    SQLITE_CACHE_SIZE = int(os.environ.get('SQLITE_CACHE_SIZE', -64 * 1024))
+
+    # Read replicas for GET requests, comma separated, see app/replicas.py
+    DATABASE_REPLICA_URLS = [url.replace('postgres://', 'postgresql://')
+                             for url in os.environ.get('DATABASE_REPLICA_URLS', '').split(',') if url]
+    REPLICA_STRATEGY = os.environ.get('REPLICA_STRATEGY', 'random')
+    REPLICA_RETRY_SECONDS = int(os.environ.get('REPLICA_RETRY_SECONDS', 30))
+    REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', 5))
+    REPLICA_TEST_MODE = os.environ.get('REPLICA_TEST_MODE', 'false').lower() == 'true'
+
+    # Request instrumentation, see app/instrumentation.py. Statements are
+    # no longer echoed; only queries slower than SLOW_QUERY_MS are logged.
+    SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS', 100))
+    REQUEST_TIMING_SAMPLE_RATE = float(os.environ.get('REQUEST_TIMING_SAMPLE_RATE', 1.0))
+    SERVER_TIMING_HEADER = os.environ.get('SERVER_TIMING_HEADER', 'true').lower() == 'true'
+
+    # Collection endpoints answer one page when no ?limit= or ?after= is
+    # given. Off until the built client in react-vite/dist asks for pages
+    # itself, see app/api/pagination.py
+    PAGINATE_BY_DEFAULT = os.environ.get('PAGINATE_BY_DEFAULT', 'false').lower() == 'true'
+
+    # 'auto' uses orjson when installed, see app/json_provider.py
+    JSON_PROVIDER = os.environ.get('JSON_PROVIDER', 'auto')
+
+    # Bearer token required to scrape /metrics, unset leaves it open
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
+    # Werkzeug password hashing. Raising the iterations rehashes each
+    # password the next time its owner logs in.
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'pbkdf2:sha256:260000')
+    PASSWORD_SALT_LENGTH = int(os.environ.get('PASSWORD_SALT_LENGTH', 16))
+
+    # Flask-Login user loader cache (per worker process)
+    USER_CACHE_SIZE = int(os.environ.get('USER_CACHE_SIZE', 1024))
+    USER_CACHE_TTL = int(os.environ.get('USER_CACHE_TTL', 60))
     
     # Session configuration for authentication
     SESSION_COOKIE_SAMESITE = "Lax"
@@ -0,0 +1,117 @@
+import os
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+
+# Engine profiles selectable with DB_PROFILE:
+#   default   SQLAlchemy's own defaults, what the app ran with before
+#   postgres  pooled, pre-pinged and recycled connections with a statement timeout
+#   pooler    Postgres behind an external pooler (PgBouncer) in transaction mode
+#   sqlite    pooled connections in WAL mode with a busy timeout
+#   auto      postgres or sqlite, going by the database url
+PROFILES = ('auto', 'default', 'postgres', 'pooler', 'sqlite')
+
+
+def profile_name(config):
+    profile = config['DB_PROFILE']
+    if profile not in PROFILES:
+        raise ValueError(f"DB_PROFILE must be one of {', '.join(PROFILES)}, not {profile!r}")
+    if profile == 'auto':
+        uri = config['SQLALCHEMY_DATABASE_URI']
+        return 'sqlite' if uri.startswith('sqlite') else 'postgres'
+    return profile
+
+
+def pool_size(config):
+    """
+    (pool_size, max_overflow) for one gunicorn worker. Every thread of the
+    worker gets a connection. With DB_MAX_CONNECTIONS set, the total is
+    shared between the WEB_CONCURRENCY workers, so they can't open more
+    than the database (or its plan) allows.
+    """
+    size = config['DB_POOL_SIZE']
+    overflow = config['DB_MAX_OVERFLOW']
+    if config['DB_MAX_CONNECTIONS']:
+        workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+        per_worker = max(1, config['DB_MAX_CONNECTIONS'] // workers)
+        size = min(size, per_worker)
+        overflow = min(overflow, per_worker - size)
+    return size, overflow
+
+
+def engine_options(config):
+    """
+    SQLALCHEMY_ENGINE_OPTIONS for the configured profile
+    """
+    profile = profile_name(config)
+    if profile == 'default':
+        return {}
+
+    size, overflow = pool_size(config)
+    options = {
+        'poolclass': QueuePool,
+        'pool_size': size,
+        'max_overflow': overflow,
+        'pool_timeout': config['DB_POOL_TIMEOUT'],
+    }
+    if profile == 'sqlite':
+        # Safe to share between threads, the pool hands each connection to
+        # one thread at a time
+        options['connect_args'] = {'check_same_thread': False,
+                                   'timeout': config['SQLITE_BUSY_TIMEOUT_MS'] / 1000}
+        return options
+
+    # Drop connections the server or a load balancer closed while idle
+    # instead of failing the request that picks them up
+    options['pool_pre_ping'] = True
+    options['pool_recycle'] = config['DB_POOL_RECYCLE']
+    # Reuse the most recent connection first, so the pool shrinks back to
+    # what the load needs and idle connections can time out
+    options['pool_use_lifo'] = True
+    timeout = config['DB_STATEMENT_TIMEOUT_MS']
+    if profile == 'postgres' and timeout:
+        options['connect_args'] = {'options': f'-c statement_timeout={timeout}'}
+    return options
+
+
+def _sqlite_pragmas(config):
+    return [
+        'PRAGMA journal_mode=WAL',
+        f"PRAGMA synchronous={config['SQLITE_SYNCHRONOUS']}",
+        f"PRAGMA mmap_size={config['SQLITE_MMAP_SIZE']}",
+        f"PRAGMA cache_size={config['SQLITE_CACHE_SIZE']}",
+    ]
+
+
+def init_app(app, db):
+    """
+    Per connection setup the engine options can't express. Call after
+    db.init_app(), with SQLALCHEMY_ENGINE_OPTIONS set from engine_options().
+    """
+    profile = profile_name(app.config)
+
+    with app.app_context():
+        engines = list(db.engines.values())
+
+    if profile == 'sqlite':
+        pragmas = _sqlite_pragmas(app.config)
+
+        def set_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+
+        for engine in engines:
+            event.listen(engine, 'connect', set_pragmas)
+
+    elif profile == 'pooler' and app.config['DB_STATEMENT_TIMEOUT_MS']:
+        # In transaction mode the pooler hands a different server connection
+        # to every transaction and rejects startup options, so the timeout
+        # is set at the start of each transaction instead
+        statement = f"SET LOCAL statement_timeout = {int(app.config['DB_STATEMENT_TIMEOUT_MS'])}"
+
+        def set_statement_timeout(connection):
+            connection.exec_driver_sql(statement)
+
+        for engine in engines:
+            event.listen(engine, 'begin', set_statement_timeout)
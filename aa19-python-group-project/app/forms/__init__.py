@@ -1,5 +1,5 @@
 from .login_form import LoginForm
-from .signup_form import SignUpForm
+from .signup_form import SignUpForm, DUPLICATE_ERRORS
 from .pokemon_form import PokemonForm
 from .review_form import ReviewForm
 from .list_form import ListForm
@@ -5,24 +5,26 @@ from app.models import User
 
 
 def user_exists(form, field):
-    # Checking if user exists
+    # Checking if user exists. The row is kept on the form, so the password
+    # check and the login route reuse it instead of querying again.
     email = field.data
-    user = User.query.filter(User.email == email).first()
-    if not user:
+    form.user = User.query.filter(User.email == email).first()
+    if not form.user:
         raise ValidationError('Email provided not found.')
 
 
 def password_matches(form, field):
     # Checking if password matches
     password = field.data
-    email = form.data['email']
-    user = User.query.filter(User.email == email).first()
-    if not user:
+    if not form.user:
         raise ValidationError('No such user exists.')
-    if not user.check_password(password):
+    if not form.user.check_password(password):
         raise ValidationError('Password was incorrect.')
 
 
 class LoginForm(FlaskForm):
+    # Set by user_exists during validation
+    user = None
+
     email = StringField('email', validators=[DataRequired(), user_exists])
     password = StringField('password', validators=[DataRequired(), password_matches])
\ No newline at end of file
@@ -1,27 +1,17 @@
 from flask_wtf import FlaskForm
 from wtforms import StringField
-from wtforms.validators import DataRequired, Email, ValidationError
-from app.models import User
+from wtforms.validators import DataRequired
 
-
-def user_exists(form, field):
-    # Checking if user exists
-    email = field.data
-    user = User.query.filter(User.email == email).first()
-    if user:
-        raise ValidationError('Email address is already in use.')
-
-
-def username_exists(form, field):
-    # Checking if username is already in use
-    username = field.data
-    user = User.query.filter(User.username == username).first()
-    if user:
-        raise ValidationError('Username is already in use.')
+# Taken emails and usernames are caught by the unique constraints on users
+# when the row is inserted, see sign_up in auth_routes.py. Checking first
+# would cost two queries and could still race another signup.
+DUPLICATE_ERRORS = {
+    'username': 'Username is already in use.',
+    'email': 'Email address is already in use.'
+}
 
 
 class SignUpForm(FlaskForm):
-    username = StringField(
-        'username', validators=[DataRequired(), username_exists])
-    email = StringField('email', validators=[DataRequired(), user_exists])
+    username = StringField('username', validators=[DataRequired()])
+    email = StringField('email', validators=[DataRequired()])
     password = StringField('password', validators=[DataRequired()])
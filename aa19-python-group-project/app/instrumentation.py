@@ -0,0 +1,123 @@
+import json
+import logging
+import random
+import time
+from contextlib import contextmanager
+from flask import g, request, has_request_context
+from flask.json.provider import JSONProvider
+from flask.logging import default_handler
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Set from SLOW_QUERY_MS by init_app, None disables the slow query log
+slow_query_ms = None
+
+
+class TimedJSONProvider(JSONProvider):
+    """
+    Wraps the app's JSON provider and adds the time spent encoding to the
+    current request's timings, so serialization shows up separately from
+    the handler's own work
+    """
+
+    def __init__(self, app, provider):
+        super().__init__(app)
+        self.provider = provider
+
+    def dumps(self, obj, **kwargs):
+        with _timed('serialize'):
+            return self.provider.dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        return self.provider.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        with _timed('serialize'):
+            return self.provider.response(*args, **kwargs)
+
+
+@contextmanager
+def _timed(name):
+    timings = g.get('request_timings') if has_request_context() else None
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] += time.perf_counter() - start
+
+
+# Every statement is timed, even on unsampled requests, so slow queries are
+# always logged. Only sampled requests pay for the per-request bookkeeping.
+@event.listens_for(Engine, 'before_cursor_execute')
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    # Kept on the execution context, which goes away with the statement even
+    # when it raises and after_cursor_execute never runs
+    context._query_start = time.perf_counter()
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _stop_query_timer(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_start
+    if slow_query_ms is not None and elapsed * 1000 >= slow_query_ms:
+        # Parameters are left out, they can hold passwords and emails
+        logger.warning('slow query (%.1f ms): %s', elapsed * 1000, ' '.join(statement.split()))
+    timings = g.get('request_timings') if has_request_context() else None
+    if timings is not None:
+        timings['queries'] += 1
+        timings['db'] += elapsed
+
+
+def init_app(app):
+    """
+    Times every sampled request: query count, database time, JSON
+    serialization time and total handler time. The numbers go out in a
+    Server-Timing header (visible in the browser's network panel) and in one
+    JSON log line per request. Queries slower than SLOW_QUERY_MS are logged
+    whether or not the request was sampled.
+    """
+    global slow_query_ms
+    slow_query_ms = app.config['SLOW_QUERY_MS']
+    sample_rate = app.config['REQUEST_TIMING_SAMPLE_RATE']
+    send_header = app.config['SERVER_TIMING_HEADER']
+
+    app.json = TimedJSONProvider(app, app.json)
+    if not logger.handlers:
+        logger.addHandler(default_handler)
+    logger.setLevel(logging.INFO)
+
+    @app.before_request
+    def start_request_timer():
+        if sample_rate >= 1 or random.random() < sample_rate:
+            g.request_timings = {'start': time.perf_counter(), 'queries': 0, 'db': 0.0, 'serialize': 0.0}
+
+    @app.after_request
+    def report_request_timings(response):
+        timings = g.pop('request_timings', None)
+        if timings is None:
+            return response
+        total_ms = (time.perf_counter() - timings['start']) * 1000
+        db_ms = timings['db'] * 1000
+        serialize_ms = timings['serialize'] * 1000
+
+        if send_header:
+            response.headers.add('Server-Timing', ', '.join([
+                f'db;dur={db_ms:.1f};desc="{timings["queries"]} queries"',
+                f'serialize;dur={serialize_ms:.1f}',
+                f'total;dur={total_ms:.1f}'
+            ]))
+        logger.info(json.dumps({
+            'method': request.method,
+            'path': request.path,
+            'endpoint': request.endpoint,
+            'status': response.status_code,
+            'queries': timings['queries'],
+            'db_ms': round(db_ms, 2),
+            'serialize_ms': round(serialize_ms, 2),
+            'total_ms': round(total_ms, 2)
+        }))
+        return response
@@ -0,0 +1,66 @@
+from datetime import date
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+class APIJSONProvider(DefaultJSONProvider):
+    """
+    The standard library encoder, with dates written as ISO 8601 (the same
+    text orjson produces) instead of Flask's HTTP date format. Models hand
+    datetimes over as-is, the encoder formats them. Keys are left in the
+    order the models declare them.
+    """
+    sort_keys = False
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, date):
+            return o.isoformat()
+        return DefaultJSONProvider.default(o)
+
+
+class ORJSONProvider(APIJSONProvider):
+    """
+    Encodes with orjson, which writes datetimes natively and builds the
+    response body as bytes in one pass. Calls that pass stdlib json options
+    (the session cookie serializer does) go through the standard encoder.
+    """
+    option = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self.option
+        if self.compact is False or (self.compact is None and self._app.debug):
+            option |= orjson.OPT_INDENT_2
+        body = orjson.dumps(obj, default=self.default, option=option | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def provider_class(name):
+    """
+    The provider for the JSON_PROVIDER setting: 'orjson', 'stdlib', or
+    'auto' for orjson when it is installed
+    """
+    if name == 'auto':
+        return ORJSONProvider if orjson else APIJSONProvider
+    if name == 'orjson':
+        if orjson is None:
+            raise RuntimeError('JSON_PROVIDER is orjson but orjson is not installed')
+        return ORJSONProvider
+    if name == 'stdlib':
+        return APIJSONProvider
+    raise ValueError(f'Unknown JSON_PROVIDER: {name}')
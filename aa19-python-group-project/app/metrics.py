@@ -0,0 +1,105 @@
+import os
+import threading
+import time
+from flask import Response, abort, g, request
+from prometheus_client import (CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge,
+                               Histogram, generate_latest, multiprocess)
+from sqlalchemy import event
+from .models import user_cache
+
+# Under gunicorn every worker writes its samples to PROMETHEUS_MULTIPROC_DIR
+# and /metrics merges the files, so the numbers cover all workers no matter
+# which one serves the scrape. gunicorn.conf.py sets the directory up.
+MULTIPROCESS = 'PROMETHEUS_MULTIPROC_DIR' in os.environ
+
+REQUESTS = Counter(
+    'http_requests_total', 'HTTP requests served.', ['endpoint', 'method', 'status'])
+LATENCY = Histogram(
+    'http_request_duration_seconds', 'Time spent handling HTTP requests.', ['endpoint', 'status'])
+IN_FLIGHT = Gauge(
+    'http_requests_in_flight', 'Requests currently being handled.', multiprocess_mode='livesum')
+POOL_CHECKED_OUT = Gauge(
+    'db_pool_connections_checked_out', 'Database connections currently checked out.',
+    multiprocess_mode='livesum')
+POOL_CHECKOUTS = Counter('db_pool_checkouts_total', 'Database connection checkouts.')
+POOL_CONNECTS = Counter('db_pool_connects_total', 'New database connections opened.')
+CACHE_LOOKUPS = Counter('cache_lookups_total', 'Cache lookups.', ['cache', 'result'])
+
+
+class _UserCacheCounter:
+    """
+    Moves the user cache's running hit / miss totals into CACHE_LOOKUPS.
+    Counting deltas per process keeps the cache itself free of metrics code
+    and stays correct in multiprocess mode, where each worker has its own
+    cache and its own counter files.
+    """
+
+    def __init__(self):
+        self._seen = {'hit': 0, 'miss': 0}
+        self._lock = threading.Lock()
+
+    def collect(self):
+        stats = user_cache.stats()
+        with self._lock:
+            for result, total in (('hit', stats['hits']), ('miss', stats['misses'])):
+                if total > self._seen[result]:
+                    CACHE_LOOKUPS.labels('user', result).inc(total - self._seen[result])
+                    self._seen[result] = total
+
+
+_user_cache_counter = _UserCacheCounter()
+
+
+def _registry():
+    if not MULTIPROCESS:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def init_app(app, db):
+    """
+    Exports Prometheus metrics at /metrics: request counts and latency by
+    endpoint and status, in-flight requests, connection pool activity and
+    cache hit / miss counts. Set METRICS_TOKEN to require
+    `Authorization: Bearer <token>` on scrapes.
+    """
+    token = app.config['METRICS_TOKEN']
+
+    with app.app_context():
+        for engine in db.engines.values():
+            event.listen(engine, 'connect', lambda *args: POOL_CONNECTS.inc())
+            event.listen(engine, 'checkout', lambda *args: (POOL_CHECKOUTS.inc(), POOL_CHECKED_OUT.inc()))
+            event.listen(engine, 'checkin', lambda *args: POOL_CHECKED_OUT.dec())
+
+    @app.before_request
+    def start_metrics_timer():
+        g.metrics_start = time.perf_counter()
+        IN_FLIGHT.inc()
+
+    @app.after_request
+    def record_request_metrics(response):
+        if 'metrics_start' in g:
+            # Unmatched URLs share one label so scanners can't blow up cardinality
+            endpoint = request.endpoint or 'unmatched'
+            status = str(response.status_code)
+            REQUESTS.labels(endpoint, request.method, status).inc()
+            LATENCY.labels(endpoint, status).observe(time.perf_counter() - g.metrics_start)
+        _user_cache_counter.collect()
+        return response
+
+    @app.teardown_request
+    def finish_in_flight(exc):
+        if g.pop('metrics_start', None) is not None:
+            IN_FLIGHT.dec()
+
+    @app.route('/metrics')
+    def metrics():
+        """
+        Prometheus metrics for every worker process
+        """
+        if token and request.headers.get('Authorization') != f'Bearer {token}':
+            abort(401)
+        _user_cache_counter.collect()
+        return Response(generate_latest(_registry()), content_type=CONTENT_TYPE_LATEST)
@@ -5,4 +5,6 @@ from .review import Review
 from .image import Image
 from .list import List
 from .list_pokemon import ListPokemon
+from .table_version import TableVersion
+from .user_cache import user_cache
 from .db import environment, SCHEMA
@@ -0,0 +1,104 @@
+import csv
+import json
+from itertools import islice
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.datastructures import MultiDict
+from app.forms import PokemonForm
+from .db import db
+from .pokemon import Pokemon
+from .image import Image
+
+FORMATS = ('ndjson', 'csv')
+
+
+def read_rows(stream, format):
+    """
+    Yields (row number, dict or None, error) for each record of a text
+    stream of NDJSON or CSV. Blank NDJSON lines are skipped, lines that
+    aren't a JSON object come back as errors.
+    """
+    if format == 'csv':
+        for number, row in enumerate(csv.DictReader(stream), start=1):
+            yield number, row, None
+        return
+    for number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield number, None, f'Invalid JSON: {e}'
+            continue
+        if not isinstance(row, dict):
+            yield number, None, 'Each line must be a JSON object'
+            continue
+        yield number, row, None
+
+
+def _new_pokemon(data, user_id):
+    pokemon = Pokemon(
+        name=data['name'],
+        type=data['type'],
+        type_secondary=data['type_secondary'],
+        region=data['region'],
+        category=data['category'],
+        description=data['description'],
+        user_id=user_id
+    )
+    if data['image_url']:
+        pokemon.images.append(Image(url=data['image_url'], user_id=user_id))
+    return pokemon
+
+
+def import_pokemon(rows, user_id, batch_size=500):
+    """
+    Validates each (row number, row, error) from read_rows() with the same
+    rules as PokemonForm and inserts the valid ones, with their image_url as
+    an Image, one transaction per batch_size rows. Bad rows are reported and
+    skipped instead of failing the import. A batch the database rejects is
+    retried row by row, so only the rows at fault are lost. Returns the
+    number of Pokemon created and a list of {'row', 'errors'}.
+    """
+    # One form, re-filled for every row. formdata=None keeps it from reading
+    # the request body, and csrf doesn't apply to rows.
+    form = PokemonForm(formdata=None, meta={'csrf': False})
+    created = 0
+    errors = []
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return created, errors
+
+        pokemon = []
+        for number, row, error in batch:
+            if error:
+                errors.append({'row': number, 'errors': {'row': [error]}})
+                continue
+            form.process(MultiDict({key: str(value) for key, value in row.items()
+                                    if key and value is not None}))
+            if not form.validate():
+                errors.append({'row': number, 'errors': form.errors})
+                continue
+            pokemon.append((number, dict(form.data)))
+
+        # Pokemon and their images go in with one flush and one commit
+        db.session.add_all(_new_pokemon(data, user_id) for number, data in pokemon)
+        try:
+            db.session.commit()
+            created += len(pokemon)
+            continue
+        except SQLAlchemyError:
+            db.session.rollback()
+
+        # Something in the batch failed in the database; save it again row
+        # by row so only the rows at fault are reported
+        for number, data in pokemon:
+            db.session.add(_new_pokemon(data, user_id))
+            try:
+                db.session.commit()
+            except SQLAlchemyError as e:
+                db.session.rollback()
+                errors.append({'row': number, 'errors': {'row': [f'Not saved: {e.__class__.__name__}']}})
+                continue
+            created += 1
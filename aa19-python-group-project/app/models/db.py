@@ -1,11 +1,51 @@
+from flask import g, has_request_context
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import TextClause
 
 import os
+import sqlite3
 environment = os.getenv("FLASK_ENV")
 SCHEMA = os.environ.get("SCHEMA")
 
 
-db = SQLAlchemy()
+class RoutingSession(Session):
+    """
+    Sends reads to the replica connection app/replicas.py opened for the
+    request (g.db_replica) and everything else to the primary. Once the
+    session writes, its later reads go to the primary too, so a request
+    always reads its own writes.
+    """
+
+    @staticmethod
+    def _is_read(clause):
+        if isinstance(clause, TextClause):
+            return clause.text.lstrip().upper().startswith('SELECT')
+        return getattr(clause, 'is_select', False)
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and self._is_read(clause):
+            replica = g.get('db_replica') if has_request_context() else None
+            if replica is not None and not self.info.get('wrote'):
+                return replica
+        elif bind is None:
+            self.info['wrote'] = True
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+
+
+# SQLite only enforces foreign keys, and so ON DELETE CASCADE, when each
+# connection asks for it
+@event.listens_for(Engine, 'connect')
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
 
 # helper function for adding prefix to foreign key column references in production
 def add_prefix_for_prod(attr):
@@ -0,0 +1,33 @@
+from flask import current_app
+from .db import db
+from .pokemon import Pokemon
+from .review import Review
+from .image import Image
+
+# Tables that can be exported, by the name used in URLs and on the CLI
+EXPORTS = {
+    'pokemon': Pokemon,
+    'reviews': Review,
+    'images': Image,
+}
+
+
+def export_ndjson(name, updated_since=None, chunk_size=1000):
+    """
+    Yields every row of an exported table as newline-delimited JSON, one
+    string per chunk_size rows, in id order. With updated_since, only rows
+    updated at or after it are included.
+
+    Rows are read with yield_per, which streams them from a server-side
+    cursor on Postgres instead of buffering the result, so memory stays flat
+    however large the table is.
+    """
+    table = EXPORTS[name].__table__
+    query = db.select(table).order_by(table.c.id)
+    if updated_since is not None:
+        query = query.where(table.c.updated_at >= updated_since)
+
+    dumps = current_app.json.dumps
+    result = db.session.execute(query.execution_options(yield_per=chunk_size))
+    for rows in result.partitions():
+        yield ''.join(dumps(dict(row._mapping)) + '\n' for row in rows)
@@ -0,0 +1,117 @@
+from functools import lru_cache
+from operator import attrgetter
+from sqlalchemy.orm import load_only, selectinload, undefer
+
+
+@lru_cache(maxsize=256)
+def _field_getter(cls, fields):
+    """
+    One attrgetter for all the fields plus the positions of relationships,
+    built once per model and field tuple instead of per row. Field tuples
+    come from the request, so the cache is bounded.
+    """
+    getter = attrgetter(*fields)
+    if len(fields) == 1:
+        getter = lambda obj, get=getter: (get(obj),)
+    relationships = tuple(i for i, field in enumerate(fields) if field in cls.RELATIONSHIP_FIELDS)
+    return getter, relationships
+
+
+class SparseFieldsMixin:
+    """
+    Lets a model serialize a subset of its fields and build the matching
+    loader options, so columns and relationships that weren't asked for are
+    never read from the database.
+
+    Models list their fields in COLUMN_FIELDS, RELATIONSHIP_FIELDS,
+    COMPUTED_FIELDS (deferred column_property values) and DERIVED_FIELDS
+    (Python properties mapped to the columns they read), and name presets in
+    VIEWS. The 'full' view is what to_dict() returns when no fields are given.
+    """
+    COLUMN_FIELDS = ()
+    RELATIONSHIP_FIELDS = ()
+    COMPUTED_FIELDS = ()
+    DERIVED_FIELDS = {}
+    VIEWS = {}
+
+    @classmethod
+    def all_fields(cls):
+        return (cls.COLUMN_FIELDS + cls.RELATIONSHIP_FIELDS + cls.COMPUTED_FIELDS
+                + tuple(cls.DERIVED_FIELDS))
+
+    @classmethod
+    def resolve_fields(cls, view=None, fields=None):
+        """
+        Turns a view name or an explicit field list into a tuple of field
+        names. Explicit fields are deduplicated and put in the model's own
+        field order, so every spelling of the same set is one tuple. Raises
+        ValueError on an unknown view or field.
+        """
+        if fields:
+            all_fields = cls.all_fields()
+            unknown = [field for field in fields if field not in all_fields]
+            if unknown:
+                raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+            return tuple(field for field in all_fields if field in fields)
+        view = view or 'full'
+        if view not in cls.VIEWS:
+            raise ValueError(f"Unknown view: {view}")
+        return cls.VIEWS[view]
+
+    @classmethod
+    def load_options(cls, fields=None):
+        """
+        Loader options that read only the requested columns, selectin-load
+        only the requested relationships and undefer requested computed fields
+        """
+        fields = fields or cls.VIEWS['full']
+        column_names = [field for field in fields if field in cls.COLUMN_FIELDS]
+        for field in fields:
+            column_names += cls.DERIVED_FIELDS.get(field, ())
+        columns = [getattr(cls, name) for name in dict.fromkeys(column_names)]
+        options = [load_only(cls.id, *columns)]
+        options += [selectinload(getattr(cls, field))
+                    for field in fields if field in cls.RELATIONSHIP_FIELDS]
+        options += [undefer(getattr(cls, field))
+                    for field in fields if field in cls.COMPUTED_FIELDS]
+        return options
+
+    @classmethod
+    def collection_query(cls, fields=None):
+        """
+        The query for a collection response. When every requested field is
+        a column it selects just those columns, so rows come back as tuples
+        without building a model instance per row; otherwise it loads models
+        with load_options(). Serialize the results with serialize_all().
+        """
+        fields = fields or cls.VIEWS['full']
+        if not all(field in cls.COLUMN_FIELDS or field in cls.COMPUTED_FIELDS for field in fields):
+            return cls.query.options(*cls.load_options(fields))
+        columns = [getattr(cls, field) for field in fields]
+        if 'id' not in fields:
+            # Keyset pagination reads the id off the last row
+            columns.append(cls.id)
+        return cls.query.with_entities(*columns)
+
+    @classmethod
+    def serialize_all(cls, rows, fields=None):
+        """
+        Dicts for the rows of a collection_query(), in order
+        """
+        fields = tuple(fields) if fields else cls.VIEWS['full']
+        if rows and not isinstance(rows[0], cls):
+            return [dict(zip(fields, row)) for row in rows]
+        return [row.to_dict(fields) for row in rows]
+
+    def to_dict(self, fields=None):
+        """
+        Datetimes are returned as-is, the app's JSON provider encodes them
+        """
+        fields = tuple(fields) if fields else self.VIEWS['full']
+        getter, relationships = _field_getter(type(self), fields)
+        values = getter(self)
+        if relationships:
+            values = list(values)
+            for i in relationships:
+                values[i] = [item.to_dict() for item in values[i]]
+        return dict(zip(fields, values))
@@ -9,10 +9,11 @@ class Image(db.Model):
         __table_args__ = {'schema': SCHEMA}
 
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('users.id')), nullable=False)
-    pokemon_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('pokemon.id')), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('users.id'), ondelete='CASCADE'), nullable=False, index=True)
+    pokemon_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('pokemon.id'), ondelete='CASCADE'), nullable=False, index=True)
     url = db.Column(db.Text, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
     # Relationships
     user = db.relationship('User', back_populates='images')
@@ -24,5 +25,5 @@ class Image(db.Model):
             'user_id': self.user_id,
             'pokemon_id': self.pokemon_id,
             'url': self.url,
-            'created_at': self.created_at.isoformat()
+            'created_at': self.created_at
         }
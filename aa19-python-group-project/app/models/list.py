@@ -1,29 +1,27 @@
 from .db import db, environment, SCHEMA, add_prefix_for_prod
+from .fields import SparseFieldsMixin
 from datetime import datetime
 
 
-class List(db.Model):
+class List(SparseFieldsMixin, db.Model):
     __tablename__ = 'lists'
 
     if environment == "production":
         __table_args__ = {'schema': SCHEMA}
 
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('users.id')), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('users.id'), ondelete='CASCADE'), nullable=False, index=True)
     name = db.Column(db.String(255), nullable=False)
     description = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     # Relationships
     user = db.relationship('User', back_populates='lists')
-    list_pokemon = db.relationship('ListPokemon', back_populates='list', cascade='all, delete-orphan')
+    list_pokemon = db.relationship('ListPokemon', back_populates='list', cascade='all, delete-orphan', passive_deletes=True)
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'user_id': self.user_id,
-            'name': self.name,
-            'description': self.description,
-            'created_at': self.created_at.isoformat(),
-            'list_pokemon': [lp.to_dict() for lp in self.list_pokemon]
-        }
+    COLUMN_FIELDS = ('id', 'user_id', 'name', 'description', 'created_at')
+    RELATIONSHIP_FIELDS = ('list_pokemon',)
+    VIEWS = {
+        'summary': COLUMN_FIELDS,
+        'full': COLUMN_FIELDS + RELATIONSHIP_FIELDS
+    }
@@ -1,15 +1,23 @@
 from .db import db, environment, SCHEMA, add_prefix_for_prod
+from .pokemon import Pokemon
+from .table_version import mark_changed
+from sqlalchemy import bindparam, text
 
 
 class ListPokemon(db.Model):
     __tablename__ = 'list_pokemon'
 
+    # A Pokemon appears in a list at most once; the index also serves
+    # lookups by list_id since that is its leading column
+    __table_args__ = (
+        db.Index('uq_list_pokemon_list_id_pokemon_id', 'list_id', 'pokemon_id', unique=True),
+    )
     if environment == "production":
-        __table_args__ = {'schema': SCHEMA}
+        __table_args__ = __table_args__ + ({'schema': SCHEMA},)
 
     id = db.Column(db.Integer, primary_key=True)
-    list_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('lists.id')), nullable=False)
-    pokemon_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('pokemon.id')), nullable=False)
+    list_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('lists.id'), ondelete='CASCADE'), nullable=False)
+    pokemon_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('pokemon.id'), ondelete='CASCADE'), nullable=False, index=True)
 
     # Relationships
     list = db.relationship('List', back_populates='list_pokemon')
@@ -21,3 +29,57 @@ class ListPokemon(db.Model):
             'list_id': self.list_id,
             'pokemon_id': self.pokemon_id
         }
+
+    @classmethod
+    def _found(cls, pokemon_ids):
+        return set(db.session.execute(
+            db.select(Pokemon.id).where(Pokemon.id.in_(pokemon_ids))).scalars())
+
+    @classmethod
+    def add_many(cls, list_id, pokemon_ids):
+        """
+        Adds the Pokemon to the list with one INSERT ... ON CONFLICT DO NOTHING
+        RETURNING pokemon_id (SQLite 3.35+ or Postgres). Only the rows this
+        insert wrote come back, so a Pokemon a concurrent request added first
+        counts as already in the list. Returns
+        {pokemon_id: 'added' | 'already_in_list' | 'not_found'}. The caller commits.
+        """
+        pokemon_ids = list(dict.fromkeys(pokemon_ids))
+        found = cls._found(pokemon_ids)
+        # Written as text, SQLAlchemy 1.4 can't compile RETURNING for SQLite
+        added = set(db.session.execute(
+            text(f"""
+                INSERT INTO {add_prefix_for_prod('list_pokemon')} (list_id, pokemon_id)
+                SELECT :list_id, id FROM {add_prefix_for_prod('pokemon')} WHERE id IN :pokemon_ids
+                ON CONFLICT (list_id, pokemon_id) DO NOTHING
+                RETURNING pokemon_id
+            """).bindparams(bindparam('pokemon_ids', expanding=True)),
+            {'list_id': list_id, 'pokemon_ids': pokemon_ids}).scalars())
+        if added:
+            mark_changed(db.session, cls.__tablename__)
+        return {id: ('added' if id in added
+                     else 'already_in_list' if id in found else 'not_found')
+                for id in pokemon_ids}
+
+    @classmethod
+    def remove_many(cls, list_id, pokemon_ids):
+        """
+        Removes the Pokemon from the list with one DELETE ... RETURNING
+        pokemon_id, so only the rows this delete removed count as removed.
+        Returns {pokemon_id: 'removed' | 'not_in_list' | 'not_found'}.
+        The caller commits.
+        """
+        pokemon_ids = list(dict.fromkeys(pokemon_ids))
+        found = cls._found(pokemon_ids)
+        removed = set(db.session.execute(
+            text(f"""
+                DELETE FROM {add_prefix_for_prod('list_pokemon')}
+                WHERE list_id = :list_id AND pokemon_id IN :pokemon_ids
+                RETURNING pokemon_id
+            """).bindparams(bindparam('pokemon_ids', expanding=True)),
+            {'list_id': list_id, 'pokemon_ids': pokemon_ids}).scalars())
+        if removed:
+            mark_changed(db.session, cls.__tablename__)
+        return {id: ('removed' if id in removed
+                     else 'not_in_list' if id in found else 'not_found')
+                for id in pokemon_ids}
@@ -1,13 +1,15 @@
 from .db import db, environment, SCHEMA, add_prefix_for_prod
+from .fields import SparseFieldsMixin
+from .review import Review
+from .image import Image
+from sqlalchemy import func
+from sqlalchemy.orm import column_property
 from datetime import datetime
 
 
-class Pokemon(db.Model):
+class Pokemon(SparseFieldsMixin, db.Model):
     __tablename__ = 'pokemon'
 
-    if environment == "production":
-        __table_args__ = {'schema': SCHEMA}
-
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(255), nullable=False)
     description = db.Column(db.Text)
@@ -15,27 +17,139 @@ class Pokemon(db.Model):
     type_secondary = db.Column(db.String(100))
     region = db.Column(db.String(100))
     category = db.Column(db.String(100))
-    user_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('users.id')))
+    user_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('users.id'), ondelete='CASCADE'), index=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+
+    # Rating aggregates, kept in step with the reviews table by
+    # adjust_ratings() in the same transaction as each review write
+    review_count = db.Column(db.Integer, nullable=False, default=0, server_default='0', index=True)
+    rating_sum = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    average_rating = db.Column(db.Float, index=True)
+    rating_1_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_2_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_3_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_4_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_5_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+    # The catalog filters compare lower(column) and page on id, so each index
+    # leads with the lowered filter columns and ends with id. Declared here
+    # so autogenerate keeps them, they are created by migration 8d2b6e0c7a15.
+    __table_args__ = (
+        db.Index('ix_pokemon_type_region', func.lower(type), func.lower(region), id),
+        db.Index('ix_pokemon_type_secondary', func.lower(type_secondary), id),
+        db.Index('ix_pokemon_region_category', func.lower(region), func.lower(category), id),
+        db.Index('ix_pokemon_category', func.lower(category), id),
+    )
+    if environment == "production":
+        __table_args__ = __table_args__ + ({'schema': SCHEMA},)
 
     # Relationships
     user = db.relationship('User', back_populates='pokemon')
-    reviews = db.relationship('Review', back_populates='pokemon', cascade='all, delete-orphan')
-    images = db.relationship('Image', back_populates='pokemon', cascade='all, delete-orphan')
-    lists = db.relationship('ListPokemon', back_populates='pokemon', cascade='all, delete-orphan')
-
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'name': self.name,
-            'description': self.description,
-            'type': self.type,
-            'type_secondary': self.type_secondary,
-            'region': self.region,
-            'category': self.category,
-            'user_id': self.user_id,
-            'created_at': self.created_at.isoformat(),
-            'reviews': [review.to_dict() for review in self.reviews],
-            'images': [image.to_dict() for image in self.images],
-            'lists': [list_pokemon.to_dict() for list_pokemon in self.lists]
+    reviews = db.relationship('Review', back_populates='pokemon', cascade='all, delete-orphan', passive_deletes=True)
+    images = db.relationship('Image', back_populates='pokemon', cascade='all, delete-orphan', passive_deletes=True)
+    lists = db.relationship('ListPokemon', back_populates='pokemon', cascade='all, delete-orphan', passive_deletes=True)
+
+    # Computed in SQL and deferred, so it costs nothing unless a view asks
+    # for it and never requires loading the image rows
+    thumbnail = column_property(
+        db.select(Image.url)
+        .where(Image.pokemon_id == id)
+        .order_by(Image.id)
+        .limit(1)
+        .scalar_subquery(),
+        deferred=True
+    )
+
+    # Columns the catalog can be filtered and faceted on
+    FACETS = ('type', 'type_secondary', 'region', 'category')
+
+    COLUMN_FIELDS = ('id', 'name', 'description', 'type', 'type_secondary',
+                     'region', 'category', 'user_id', 'created_at',
+                     'review_count', 'average_rating')
+    RELATIONSHIP_FIELDS = ('reviews', 'images', 'lists')
+    COMPUTED_FIELDS = ('thumbnail',)
+    DERIVED_FIELDS = {
+        'rating_histogram': ('rating_1_count', 'rating_2_count', 'rating_3_count',
+                             'rating_4_count', 'rating_5_count')
+    }
+    VIEWS = {
+        'summary': ('id', 'name', 'type', 'type_secondary', 'region',
+                    'thumbnail', 'average_rating', 'review_count'),
+        'full': COLUMN_FIELDS + ('rating_histogram',) + RELATIONSHIP_FIELDS
+    }
+
+    @property
+    def rating_histogram(self):
+        return {str(rating): getattr(self, f'rating_{rating}_count') for rating in range(1, 6)}
+
+    @classmethod
+    def adjust_ratings(cls, pokemon_id, added=None, removed=None):
+        """
+        Shifts the stored aggregates for one review being added (added=rating),
+        deleted (removed=rating) or re-rated (both). It is a single UPDATE in
+        the caller's transaction with the arithmetic done in SQL, so concurrent
+        review writes can't overwrite each other's counts.
+        """
+        count_delta = (added is not None) - (removed is not None)
+        sum_delta = (added or 0) - (removed or 0)
+        new_count = cls.review_count + count_delta
+        new_sum = cls.rating_sum + sum_delta
+        values = {
+            cls.review_count: new_count,
+            cls.rating_sum: new_sum,
+            cls.average_rating: db.case(
+                (new_count > 0, db.cast(new_sum, db.Float) / new_count),
+                else_=None
+            )
         }
+        if added != removed:
+            if added is not None:
+                column = getattr(cls, f'rating_{added}_count')
+                values[column] = column + 1
+            if removed is not None:
+                column = getattr(cls, f'rating_{removed}_count')
+                values[column] = column - 1
+        cls.query.filter(cls.id == pokemon_id).update(values, synchronize_session=False)
+
+    @classmethod
+    def rebuild_ratings(cls):
+        """
+        Recomputes every Pokemon's aggregates from the reviews table in one
+        set-based UPDATE. Returns the number of rows updated.
+        """
+        def per_pokemon(expression):
+            return (db.select(expression)
+                    .where(Review.pokemon_id == cls.id)
+                    .scalar_subquery())
+
+        values = {
+            cls.review_count: per_pokemon(db.func.count(Review.id)),
+            cls.rating_sum: per_pokemon(db.func.coalesce(db.func.sum(Review.rating), 0)),
+            cls.average_rating: per_pokemon(db.cast(db.func.avg(Review.rating), db.Float))
+        }
+        for rating in range(1, 6):
+            values[getattr(cls, f'rating_{rating}_count')] = per_pokemon(
+                db.func.count(Review.id).filter(Review.rating == rating))
+        return cls.query.update(values, synchronize_session=False)
+
+    @classmethod
+    def rating_drift(cls):
+        """
+        Returns (pokemon_id, stored, actual) for every Pokemon whose stored
+        review_count or rating_sum disagrees with its reviews
+        """
+        actual = (db.select(Review.pokemon_id,
+                            db.func.count(Review.id).label('review_count'),
+                            db.func.sum(Review.rating).label('rating_sum'))
+                  .group_by(Review.pokemon_id)
+                  .subquery())
+        actual_count = db.func.coalesce(actual.c.review_count, 0)
+        actual_sum = db.func.coalesce(actual.c.rating_sum, 0)
+        rows = (db.session.query(cls.id, cls.review_count, cls.rating_sum, actual_count, actual_sum)
+                .outerjoin(actual, actual.c.pokemon_id == cls.id)
+                .filter(db.or_(cls.review_count != actual_count, cls.rating_sum != actual_sum))
+                .order_by(cls.id)
+                .all())
+        return [(id, (count, total), (real_count, real_total))
+                for id, count, total, real_count, real_total in rows]
@@ -1,34 +1,30 @@
 from .db import db, environment, SCHEMA, add_prefix_for_prod
+from .fields import SparseFieldsMixin
 from datetime import datetime
 
 
-class Review(db.Model):
+class Review(SparseFieldsMixin, db.Model):
     __tablename__ = 'reviews'
 
     if environment == "production":
         __table_args__ = {'schema': SCHEMA}
 
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('users.id')), nullable=False)
-    pokemon_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('pokemon.id')), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('users.id'), ondelete='CASCADE'), nullable=False, index=True)
+    pokemon_id = db.Column(db.Integer, db.ForeignKey(add_prefix_for_prod('pokemon.id'), ondelete='CASCADE'), nullable=False, index=True)
     rating = db.Column(db.Integer, nullable=False)
     title = db.Column(db.String(255))
     body = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
     # Relationships
     user = db.relationship('User', back_populates='reviews')
     pokemon = db.relationship('Pokemon', back_populates='reviews')
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'user_id': self.user_id,
-            'pokemon_id': self.pokemon_id,
-            'rating': self.rating,
-            'title': self.title,
-            'body': self.body,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
-        }
+    COLUMN_FIELDS = ('id', 'user_id', 'pokemon_id', 'rating', 'title', 'body',
+                     'created_at', 'updated_at')
+    VIEWS = {
+        'summary': ('id', 'user_id', 'pokemon_id', 'rating', 'title', 'created_at'),
+        'full': COLUMN_FIELDS
+    }
@@ -0,0 +1,56 @@
+import re
+from sqlalchemy import text
+from .db import db, add_prefix_for_prod
+
+
+def _terms(query):
+    # Only word characters reach the index, so user input can never break
+    # out of the FTS5 / tsquery syntax
+    return re.findall(r'\w+', query.lower())
+
+
+def search_catalog(query, limit, offset=0):
+    """
+    Ranked full text search over Pokemon (name, types, region, category,
+    description) and reviews (title, body), backed by the FTS5 tables on
+    SQLite and the GIN indexed search_vector columns on Postgres. Every term
+    must match, as a prefix. Returns (kind, id, rank) rows, best match first.
+    """
+    terms = _terms(query)
+    if not terms:
+        return []
+
+    if db.engine.dialect.name == 'postgresql':
+        pokemon = add_prefix_for_prod('pokemon')
+        reviews = add_prefix_for_prod('reviews')
+        sql = f"""
+            SELECT 'pokemon' AS kind, id, ts_rank(search_vector, q) AS rank
+            FROM {pokemon}, to_tsquery('english', :query) q
+            WHERE search_vector @@ q
+            UNION ALL
+            SELECT 'review' AS kind, id, ts_rank(search_vector, q) AS rank
+            FROM {reviews}, to_tsquery('english', :query) q
+            WHERE search_vector @@ q
+            ORDER BY rank DESC, kind, id
+            LIMIT :limit OFFSET :offset
+        """
+        match = ' & '.join(f'{term}:*' for term in terms)
+    else:
+        # bm25() is lower-is-better, negate it so both backends sort DESC.
+        # Column weights favour the name, then the types.
+        sql = """
+            SELECT 'pokemon' AS kind, rowid AS id,
+                   -bm25(pokemon_fts, 10.0, 4.0, 4.0, 2.0, 2.0, 1.0) AS rank
+            FROM pokemon_fts
+            WHERE pokemon_fts MATCH :query
+            UNION ALL
+            SELECT 'review' AS kind, rowid AS id, -bm25(reviews_fts, 3.0, 1.0) AS rank
+            FROM reviews_fts
+            WHERE reviews_fts MATCH :query
+            ORDER BY rank DESC, kind, id
+            LIMIT :limit OFFSET :offset
+        """
+        match = ' '.join(f'"{term}"*' for term in terms)
+
+    rows = db.session.execute(text(sql), {'query': match, 'limit': limit, 'offset': offset})
+    return [(row.kind, row.id, row.rank) for row in rows]
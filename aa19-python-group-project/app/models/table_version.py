@@ -0,0 +1,103 @@
+from .db import db, environment, SCHEMA
+from datetime import datetime
+from functools import lru_cache
+
+
+class TableVersion(db.Model):
+    """
+    A counter per table, bumped in the same transaction as every write to
+    that table. Read routes build their ETag / Last-Modified validators from
+    these rows instead of from the data itself.
+    """
+    __tablename__ = 'table_versions'
+
+    if environment == "production":
+        __table_args__ = {'schema': SCHEMA}
+
+    name = db.Column(db.String(64), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    @classmethod
+    def current(cls, tables):
+        """
+        Returns {table: (version, updated_at)} for the given table names in
+        one Core query. Tables without a row yet report version 0.
+        """
+        rows = db.session.execute(
+            db.select(cls.name, cls.version, cls.updated_at).where(cls.name.in_(tables)))
+        versions = {name: (0, datetime.min) for name in tables}
+        versions.update({name: (version, updated_at) for name, version, updated_at in rows})
+        return versions
+
+    @classmethod
+    def bump(cls, session, tables):
+        now = datetime.utcnow()
+        for name in sorted(tables):
+            result = session.execute(
+                db.update(cls)
+                .where(cls.name == name)
+                .values(version=cls.version + 1, updated_at=now)
+                .execution_options(synchronize_session=False))
+            if result.rowcount == 0:
+                session.execute(db.insert(cls).values(name=name, version=1, updated_at=now))
+
+
+def _changed_tables(session):
+    return session.info.setdefault('changed_tables', set())
+
+
+def mark_changed(session, *tables):
+    """
+    Records a write the hooks below can't see, like a text() statement,
+    which has no mapper to tell them its table
+    """
+    _changed_tables(session).update(tables)
+
+
+@lru_cache(maxsize=None)
+def _cascaded_tables(mapper):
+    # Children removed by ON DELETE CASCADE (passive_deletes) never pass
+    # through the session, so a delete counts as a write to their tables too
+    tables = set()
+    for relationship in mapper.relationships:
+        if relationship.passive_deletes and relationship.cascade.delete:
+            tables.add(relationship.mapper.local_table.name)
+            if relationship.mapper is not mapper:
+                tables |= _cascaded_tables(relationship.mapper)
+    return frozenset(tables)
+
+
+@db.event.listens_for(db.session, 'after_flush')
+def _collect_flushed_tables(session, flush_context):
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        table = getattr(obj, '__table__', None)
+        if table is not None and table.name != TableVersion.__tablename__:
+            _changed_tables(session).add(table.name)
+    for obj in session.deleted:
+        mapper = db.inspect(obj).mapper
+        _changed_tables(session).update(_cascaded_tables(mapper))
+
+
+@db.event.listens_for(db.session, 'do_orm_execute')
+def _collect_bulk_tables(orm_execute_state):
+    # query.update() / query.delete() and ORM insert()/update() statements
+    # skip the flush, so catch them here
+    if orm_execute_state.is_select:
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.local_table.name != TableVersion.__tablename__:
+        _changed_tables(orm_execute_state.session).add(mapper.local_table.name)
+
+
+@db.event.listens_for(db.session, 'before_commit')
+def _bump_changed_tables(session):
+    session.flush()
+    changed = session.info.pop('changed_tables', None)
+    if changed:
+        TableVersion.bump(session, changed)
+
+
+@db.event.listens_for(db.session, 'after_rollback')
+def _forget_changed_tables(session):
+    session.info.pop('changed_tables', None)
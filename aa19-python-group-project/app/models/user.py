@@ -1,8 +1,31 @@
 from .db import db, environment, SCHEMA, add_prefix_for_prod
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import generate_password_hash, check_password_hash, DEFAULT_PBKDF2_ITERATIONS
+from flask import current_app
 from flask_login import UserMixin
 
 
+def hash_password(password):
+    """
+    Hashes with the PASSWORD_HASH_METHOD and PASSWORD_SALT_LENGTH settings
+    """
+    return generate_password_hash(password, current_app.config['PASSWORD_HASH_METHOD'],
+                                  current_app.config['PASSWORD_SALT_LENGTH'])
+
+
+def hash_settings(method):
+    """
+    (algorithm, iterations) of a werkzeug hash method with werkzeug's
+    defaults filled in, so 'pbkdf2:sha256' and 'pbkdf2:sha256:260000'
+    compare equal. Methods other than pbkdf2 have no iterations.
+    """
+    parts = method.split(':')
+    if parts[0] != 'pbkdf2':
+        return method, None
+    algorithm = parts[1] if len(parts) > 1 else 'sha256'
+    iterations = int(parts[2]) if len(parts) > 2 else DEFAULT_PBKDF2_ITERATIONS
+    return f'pbkdf2:{algorithm}', iterations
+
+
 class User(db.Model, UserMixin):
     __tablename__ = 'users'
 
@@ -15,10 +38,10 @@ class User(db.Model, UserMixin):
     hashed_password = db.Column(db.String(255), nullable=False)
 
     # Relationships
-    pokemon = db.relationship('Pokemon', back_populates='user', cascade='all, delete-orphan')
-    reviews = db.relationship('Review', back_populates='user', cascade='all, delete-orphan')
-    lists = db.relationship('List', back_populates='user', cascade='all, delete-orphan')
-    images = db.relationship('Image', back_populates='user', cascade='all, delete-orphan')
+    pokemon = db.relationship('Pokemon', back_populates='user', cascade='all, delete-orphan', passive_deletes=True)
+    reviews = db.relationship('Review', back_populates='user', cascade='all, delete-orphan', passive_deletes=True)
+    lists = db.relationship('List', back_populates='user', cascade='all, delete-orphan', passive_deletes=True)
+    images = db.relationship('Image', back_populates='user', cascade='all, delete-orphan', passive_deletes=True)
 
     @property
     def password(self):
@@ -26,11 +49,21 @@ class User(db.Model, UserMixin):
 
     @password.setter
     def password(self, password):
-        self.hashed_password = generate_password_hash(password)
+        self.hashed_password = hash_password(password)
 
     def check_password(self, password):
         return check_password_hash(self.password, password)
 
+    def password_needs_rehash(self):
+        """
+        True when the stored hash was made with other settings than the
+        current ones, e.g. before PASSWORD_HASH_METHOD raised the iterations
+        """
+        method, _, rest = self.hashed_password.partition('$')
+        salt = rest.partition('$')[0]
+        return (hash_settings(method) != hash_settings(current_app.config['PASSWORD_HASH_METHOD'])
+                or len(salt) != current_app.config['PASSWORD_SALT_LENGTH'])
+
     def to_dict(self):
         return {
             'id': self.id,
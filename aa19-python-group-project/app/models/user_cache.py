@@ -0,0 +1,112 @@
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from .db import db
+from .user import User
+
+
+class UserCache:
+    """
+    Bounded, TTL'd LRU cache for the Flask-Login user loader.
+
+    Entries are detached User snapshots. load() merges a snapshot into the
+    request's session with load=False, which attaches a copy without any SQL,
+    so relationships still lazy-load normally and the shared snapshot is
+    never handed to a request. One lock guards the dict, so a cache can be
+    shared by every thread in a gunicorn worker. Each worker process keeps
+    its own cache, so edits made through another worker show up after at
+    most ttl seconds.
+    """
+
+    def __init__(self, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def configure(self, maxsize, ttl):
+        with self._lock:
+            self.maxsize = maxsize
+            self.ttl = ttl
+            self._entries.clear()
+
+    def load(self, user_id):
+        snapshot = self._get(user_id)
+        if snapshot is not None:
+            return db.session.merge(snapshot, load=False)
+        user = db.session.get(User, user_id)
+        if user is not None:
+            self._put(user)
+        return user
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'miss_rate': self.misses / lookups if lookups else 0.0
+            }
+
+    def _get(self, user_id):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            return None
+
+    def _put(self, user):
+        if self.maxsize <= 0:
+            return
+        snapshot = User(**{attr.key: getattr(user, attr.key)
+                           for attr in inspect(User).column_attrs})
+        make_transient_to_detached(snapshot)
+        with self._lock:
+            self._entries[user.id] = (time.monotonic() + self.ttl, snapshot)
+            self._entries.move_to_end(user.id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+user_cache = UserCache()
+
+
+# Drop cached users once a change to them is committed. Invalidating only
+# after commit means another thread can't re-cache the old row in between.
+@db.event.listens_for(User, 'after_update')
+@db.event.listens_for(User, 'after_delete')
+def _mark_user_stale(mapper, connection, target):
+    session = inspect(target).session
+    if session is not None:
+        session.info.setdefault('stale_user_ids', set()).add(target.id)
+
+
+@db.event.listens_for(db.session, 'after_commit')
+def _invalidate_stale_users(session):
+    for user_id in session.info.pop('stale_user_ids', ()):
+        user_cache.invalidate(user_id)
+
+
+@db.event.listens_for(db.session, 'after_rollback')
+def _forget_stale_users(session):
+    session.info.pop('stale_user_ids', None)
@@ -0,0 +1,159 @@
+"""
+Read replicas for GET requests.
+
+DATABASE_REPLICA_URLS lists the replicas, each becomes a replica_<n> bind
+with the same engine profile as the primary. GET and HEAD requests to the
+blueprints in REPLICA_BLUEPRINTS are given one replica, picked by
+REPLICA_STRATEGY, and RoutingSession (app/models/db.py) reads from it until
+the request writes. A request that writes also keeps its client on the
+primary for REPLICA_STICKY_SECONDS, long enough for the replicas to catch up
+with what it wrote.
+
+A replica that can't be connected to is skipped for REPLICA_RETRY_SECONDS
+and the request tries the next one. With no healthy replica, reads fall
+back to the primary.
+
+Test mode: REPLICA_TEST_MODE=true with a SQLite primary and no replica urls
+uses a second SQLite file next to the primary as the replica, copied from
+the primary on startup. `flask replicas sync` copies it again, so the lag
+between writes and the replica seeing them is in your hands.
+"""
+import itertools
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from flask import g, request, session
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+
+REPLICA_BLUEPRINTS = ('pokemon', 'reviews', 'lists', 'images', 'users')
+STRATEGIES = ('random', 'round_robin')
+
+logger = logging.getLogger(__name__)
+
+_primary = None
+_replicas = []
+_down_until = {}
+_lock = threading.Lock()
+_round_robin = itertools.count()
+retry_seconds = 30
+
+
+def replica_urls(config):
+    urls = config['DATABASE_REPLICA_URLS']
+    primary = config['SQLALCHEMY_DATABASE_URI']
+    if not urls and config['REPLICA_TEST_MODE'] and primary.startswith('sqlite:///'):
+        root, extension = os.path.splitext(primary)
+        urls = [f'{root}-replica{extension or ".db"}']
+    return urls
+
+
+def binds(config, engine_options):
+    """
+    SQLALCHEMY_BINDS entries for the replicas
+    """
+    return {f'replica_{i}': {'url': url, **engine_options}
+            for i, url in enumerate(replica_urls(config))}
+
+
+def _mark_down(engine):
+    with _lock:
+        _down_until[engine] = time.monotonic() + retry_seconds
+    logger.warning('Replica %s is unavailable, skipping it for %ss', engine.url, retry_seconds)
+
+
+def _candidates(strategy):
+    now = time.monotonic()
+    with _lock:
+        available = [engine for engine in _replicas if _down_until.get(engine, 0) <= now]
+    if strategy == 'round_robin' and available:
+        start = next(_round_robin) % len(available)
+        return available[start:] + available[:start]
+    random.shuffle(available)
+    return available
+
+
+def connect(strategy):
+    """
+    A connection to a replica picked by strategy, or None to read from the
+    primary. The connection is opened here, so a replica that is down is
+    marked and passed over before the request uses it, and a replica whose
+    retry window has passed gets its health checked by the same connect.
+    """
+    for engine in _candidates(strategy):
+        try:
+            connection = engine.connect()
+        except DBAPIError:
+            _mark_down(engine)
+            continue
+        with _lock:
+            _down_until.pop(engine, None)
+        return connection
+    return None
+
+
+def sync():
+    """
+    Copies a SQLite primary into each SQLite replica (test mode). Returns
+    the number of replicas synced.
+    """
+    for engine in _replicas:
+        if _primary.dialect.name != 'sqlite' or engine.dialect.name != 'sqlite':
+            raise RuntimeError('Only SQLite replicas can be synced')
+        source = sqlite3.connect(_primary.url.database)
+        target = sqlite3.connect(engine.url.database)
+        with target:
+            source.backup(target)
+        source.close()
+        target.close()
+    return len(_replicas)
+
+
+def init_app(app, db):
+    global _primary, retry_seconds
+    if app.config['REPLICA_STRATEGY'] not in STRATEGIES:
+        raise ValueError(f"REPLICA_STRATEGY must be one of {', '.join(STRATEGIES)}")
+    retry_seconds = app.config['REPLICA_RETRY_SECONDS']
+
+    with app.app_context():
+        _primary = db.engine
+        _replicas[:] = [engine for key, engine in db.engines.items()
+                        if key is not None and key.startswith('replica_')]
+        if app.config['REPLICA_TEST_MODE'] and _replicas:
+            sync()
+
+    def on_error(context):
+        # Lost connections in the middle of a request
+        if context.is_disconnect:
+            _mark_down(context.engine)
+
+    for engine in _replicas:
+        event.listen(engine, 'handle_error', on_error)
+
+    @app.before_request
+    def route_reads_to_replica():
+        g.db_replica = None
+        if (not _replicas or request.method not in ('GET', 'HEAD')
+                or request.blueprint not in REPLICA_BLUEPRINTS):
+            return
+        if session.get('read_primary_until', 0) > time.time():
+            return
+        g.db_replica = connect(app.config['REPLICA_STRATEGY'])
+
+    @app.after_request
+    def stick_to_primary_after_write(response):
+        sticky = app.config['REPLICA_STICKY_SECONDS']
+        if _replicas and sticky and db.session.info.get('wrote'):
+            session['read_primary_until'] = time.time() + sticky
+        return response
+
+    @app.teardown_request
+    def release_replica(exception=None):
+        connection = g.pop('db_replica', None)
+        if connection is not None:
+            # The session's transaction runs on this connection, end it first
+            db.session.remove()
+            connection.close()
@@ -1,11 +1,14 @@
+import click
 from flask.cli import AppGroup
 from .users import seed_users, undo_users
 from .pokemon import seed_pokemon, undo_pokemon
 from .reviews import seed_reviews, undo_reviews
 from .lists import seed_lists, undo_lists
 from .images import seed_images, undo_images
+from .synthetic import seed_synthetic
 
 from app.models.db import db, environment, SCHEMA
+from app.models import Pokemon
 
 # Creates a seed group to hold our commands
 # So we can type `flask seed --help`
@@ -31,10 +34,29 @@ def seed():
     reviews = seed_reviews()
     lists = seed_lists()
     images = seed_images()
+
+    # Reviews are inserted directly, so bring the rating aggregates up to date
+    Pokemon.rebuild_ratings()
+    db.session.commit()
     
     print("✅ All seeds completed successfully!")
 
 
+# Creates the `flask seed synthetic` command for load and capacity testing
+@seed_commands.command('synthetic')
+@click.option('--users', type=click.IntRange(min=1), default=1000, show_default=True)
+@click.option('--pokemon', type=click.IntRange(min=0), default=10000, show_default=True)
+@click.option('--reviews-per-pokemon', type=click.IntRange(min=0), default=10, show_default=True,
+              help='Average; the count per Pokemon varies between 0 and twice this.')
+@click.option('--seed', type=int, default=0, show_default=True,
+              help='Random seed, the same seed generates the same data.')
+@click.option('--batch-size', type=click.IntRange(min=1), default=10000, show_default=True)
+def synthetic(users, pokemon, reviews_per_pokemon, seed, batch_size):
+    counts = seed_synthetic(users, pokemon, reviews_per_pokemon, seed, batch_size)
+    summary = ', '.join(f'{count} {table}' for table, count in counts.items())
+    print(f"✅ Synthetic seed completed: {summary}")
+
+
 # Creates the `flask seed undo` command
 @seed_commands.command('undo')
 def undo():
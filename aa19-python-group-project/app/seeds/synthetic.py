@@ -0,0 +1,160 @@
+import csv
+import io
+import random
+from datetime import datetime, timedelta
+from itertools import islice
+from app.models import db, Pokemon, TableVersion
+from app.models.user import hash_password
+from app.models.db import add_prefix_for_prod
+
+TYPES = ['Normal', 'Fire', 'Water', 'Grass', 'Electric', 'Ice', 'Fighting', 'Poison', 'Ground',
+         'Flying', 'Psychic', 'Bug', 'Rock', 'Ghost', 'Dragon', 'Dark', 'Steel', 'Fairy']
+REGIONS = ['Kanto', 'Johto', 'Hoenn', 'Sinnoh', 'Unova', 'Kalos', 'Alola', 'Galar', 'Paldea']
+CATEGORIES = ['Mouse', 'Flame', 'Seed', 'Shellfish', 'Shadow', 'Dragon', 'Lizard', 'Bat',
+              'Fox', 'Balloon', 'Bird', 'Fish', 'Psi', 'Iron Ball', 'Mushroom', 'Scorpion']
+SYLLABLES = ['pi', 'ka', 'chu', 'char', 'man', 'der', 'bul', 'ba', 'saur', 'squir', 'tle',
+             'gen', 'gar', 'dra', 'go', 'nite', 'eev', 'ee', 'mew', 'tw', 'zu', 'bat', 'lu',
+             'cario', 'ra', 'lts', 'ga', 'rdo', 'vo', 'rb', 'sno', 'rlax']
+TRAITS = ['stores energy in its tail', 'hides in tall grass', 'glows faintly at night',
+          'can swim for days without rest', 'is fiercely loyal to its trainer',
+          'sleeps through most of the day', 'sheds its skin every season',
+          'hums a soothing melody', 'is rarely seen near cities']
+TITLES = ['Absolutely amazing', 'Worth the trip', 'Pretty good overall', 'Not what I expected',
+          'A must see', 'Crowded but fun', 'Would battle again', 'Overrated', 'Hidden gem']
+BODIES = ['The habitat was beautiful and the Pokemon was friendly.',
+          'Took a while to find, but it was worth the wait.',
+          'Great for beginner trainers, a bit too easy for veterans.',
+          'It used a move I had never seen before. Incredible!',
+          'Bring plenty of potions, it hits hard.',
+          'My whole team loved it. We will be back next season.']
+# Reviews skew positive, like on most review sites
+RATING_WEIGHTS = [5, 8, 17, 32, 38]
+SPREAD = timedelta(days=730)
+
+
+def _timestamp(rng, now):
+    return (now - rng.random() * SPREAD).strftime('%Y-%m-%d %H:%M:%S.%f')
+
+
+def _next_id(table):
+    return db.session.execute(db.text(f"SELECT COALESCE(MAX(id), 0) FROM {table}")).scalar() + 1
+
+
+def _bulk_insert(table, columns, rows, batch_size):
+    """
+    Streams rows into table in batches on the session's connection: COPY on
+    Postgres, executemany on SQLite. Returns the number of rows written.
+    """
+    connection = db.session.connection()
+    postgres = connection.dialect.name == 'postgresql'
+    column_list = ', '.join(columns)
+    written = 0
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return written
+        if postgres:
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(batch)
+            buffer.seek(0)
+            cursor = connection.connection.cursor()
+            cursor.copy_expert(f"COPY {table} ({column_list}) FROM STDIN WITH (FORMAT csv)", buffer)
+            cursor.close()
+        else:
+            placeholders = ', '.join('?' for _ in columns)
+            connection.exec_driver_sql(
+                f"INSERT INTO {table} ({column_list}) VALUES ({placeholders})", batch)
+        written += len(batch)
+
+
+def _sync_sequence(table):
+    # Explicit ids leave Postgres' serial sequence behind, catch it up
+    if db.session.connection().dialect.name == 'postgresql':
+        db.session.execute(db.text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT MAX(id) FROM {table}))"))
+
+
+def seed_synthetic(users, pokemon, reviews_per_pokemon, seed=0, batch_size=10000):
+    """
+    Generates a reproducible synthetic catalog: users, Pokemon with one
+    image each, and on average reviews_per_pokemon reviews per Pokemon.
+    Rows are generated lazily and written in bulk, so memory stays flat at
+    millions of rows. Returns the number of rows written per table.
+    """
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    tables = {name: add_prefix_for_prod(name) for name in ('users', 'pokemon', 'images', 'reviews')}
+    counts = {}
+
+    # Hashing is deliberately slow, every synthetic user shares one hash
+    hashed_password = hash_password('password')
+    first_user = _next_id(tables['users'])
+    counts['users'] = _bulk_insert(
+        tables['users'], ['id', 'username', 'email', 'hashed_password'],
+        ((id, f'trainer{id}', f'trainer{id}@synthetic.pokeyelp.io', hashed_password)
+         for id in range(first_user, first_user + users)),
+        batch_size)
+    _sync_sequence(tables['users'])
+    db.session.commit()
+    last_user = first_user + users - 1
+
+    def pokemon_rows():
+        for id in range(first_pokemon, first_pokemon + pokemon):
+            name = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+            primary, secondary = rng.sample(TYPES, 2)
+            created_at = _timestamp(rng, now)
+            yield (id, f'{name} {id}', f'A {primary}-type Pokemon that {rng.choice(TRAITS)}.',
+                   primary, secondary if rng.random() < 0.4 else None, rng.choice(REGIONS),
+                   f'{rng.choice(CATEGORIES)} Pokémon', rng.randint(first_user, last_user),
+                   created_at, created_at)
+
+    first_pokemon = _next_id(tables['pokemon'])
+    counts['pokemon'] = _bulk_insert(
+        tables['pokemon'],
+        ['id', 'name', 'description', 'type', 'type_secondary', 'region', 'category',
+         'user_id', 'created_at', 'updated_at'],
+        pokemon_rows(), batch_size)
+    _sync_sequence(tables['pokemon'])
+    db.session.commit()
+    pokemon_ids = range(first_pokemon, first_pokemon + pokemon)
+
+    def image_rows():
+        for id, pokemon_id in enumerate(pokemon_ids, start=first_image):
+            artwork = (pokemon_id - 1) % 1025 + 1
+            created_at = _timestamp(rng, now)
+            yield (id, rng.randint(first_user, last_user), pokemon_id,
+                   'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/'
+                   f'other/official-artwork/{artwork}.png',
+                   created_at, created_at)
+
+    first_image = _next_id(tables['images'])
+    counts['images'] = _bulk_insert(
+        tables['images'], ['id', 'user_id', 'pokemon_id', 'url', 'created_at', 'updated_at'],
+        image_rows(), batch_size)
+    _sync_sequence(tables['images'])
+    db.session.commit()
+
+    def review_rows():
+        id = first_review
+        for pokemon_id in pokemon_ids:
+            # Vary the count per Pokemon around the requested average
+            for _ in range(rng.randint(0, 2 * reviews_per_pokemon)):
+                created_at = _timestamp(rng, now)
+                yield (id, rng.randint(first_user, last_user), pokemon_id,
+                       rng.choices(range(1, 6), RATING_WEIGHTS)[0], rng.choice(TITLES),
+                       ' '.join(rng.sample(BODIES, 2)), created_at, created_at)
+                id += 1
+
+    first_review = _next_id(tables['reviews'])
+    counts['reviews'] = _bulk_insert(
+        tables['reviews'],
+        ['id', 'user_id', 'pokemon_id', 'rating', 'title', 'body', 'created_at', 'updated_at'],
+        review_rows(), batch_size)
+    _sync_sequence(tables['reviews'])
+
+    # Raw inserts skip the ORM, so refresh the aggregates and validators here
+    Pokemon.rebuild_ratings()
+    TableVersion.bump(db.session, {'users', 'pokemon', 'images', 'reviews'})
+    db.session.commit()
+    return counts
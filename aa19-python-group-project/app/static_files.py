@@ -0,0 +1,47 @@
+import mimetypes
+import os
+import re
+from flask import abort, current_app, request, send_file
+from werkzeug.security import safe_join
+
+# Vite names built assets like assets/index-fc6a8850.js, the hash changes
+# whenever the content does, so those files can be cached forever
+HASHED_ASSET = re.compile(r'(^|/)assets/.+-[\w-]{8}\.\w+$')
+IMMUTABLE = 'public, max-age=31536000, immutable'
+
+# Precompressed variants written by `flask assets compress`, best first
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def send_asset(filename):
+    """
+    Serves a file from the React build. Prefers a prebuilt .br or .gz next
+    to it when the client accepts that encoding, marks hashed assets
+    immutable and has everything else (index.html) revalidated with
+    ETag / Last-Modified. Files go out through send_file, which hands them
+    to the server's sendfile (wsgi.file_wrapper) when it has one.
+    """
+    path = safe_join(current_app.static_folder, filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+
+    mimetype = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+    encoding = None
+    for name, suffix in ENCODINGS:
+        if name in request.accept_encodings and os.path.isfile(path + suffix):
+            encoding, path = name, path + suffix
+            break
+
+    immutable = bool(HASHED_ASSET.search(filename))
+    response = send_file(path, mimetype=mimetype, conditional=True, etag=True)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.headers['Cache-Control'] = IMMUTABLE if immutable else 'no-cache'
+    return response
+
+
+def init_app(app):
+    # Flask's own static route (static_url_path='/') serves every built file
+    # that exists, route it through send_asset as well
+    app.view_functions['static'] = send_asset
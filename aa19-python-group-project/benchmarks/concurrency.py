@@ -0,0 +1,150 @@
+"""
+Throughput of one worker under concurrent load, per engine profile.
+
+Boots the app like benchmarks/endpoints.py once for each DB_PROFILE given
+(in a fresh process, the profile is read at import) and has --threads
+clients, each logged in as its own user, send requests for --duration
+seconds. Most requests are reads across the main GET routes; --write-ratio
+of them create and then delete a review. Reports requests per second,
+latency percentiles and errors per profile, and the throughput of each
+profile against the first one:
+
+    python benchmarks/concurrency.py --profiles default sqlite --threads 8
+
+The pool is sized for --threads, as GUNICORN_THREADS would size it for a
+gunicorn worker with that many threads.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from endpoints import build_app, percentile
+
+READS = [
+    '/api/pokemon/?view=summary&limit=50',
+    '/api/pokemon/?type=fire',
+    '/api/pokemon/facets',
+    '/api/pokemon/{id}',
+    '/api/reviews/pokemon/{id}/reviews',
+    '/api/images/pokemon/{id}',
+    '/api/search?q=fire',
+]
+
+
+def client_loop(app, email, args, deadline, seed, results):
+    rng = random.Random(seed)
+    client = app.test_client()
+    client.get('/api/auth/')  # sets the csrf_token cookie
+    response = client.post('/api/auth/login', json={'email': email, 'password': 'password'})
+    if response.status_code != 200:
+        results.append(('login', 0, response.status_code))
+        return
+
+    while time.perf_counter() < deadline:
+        pokemon_id = rng.randint(1, args.pokemon)
+        if rng.random() < args.write_ratio:
+            start = time.perf_counter()
+            response = client.post(f'/api/reviews/pokemon/{pokemon_id}/reviews',
+                                   json={'rating': 3, 'title': 'Load', 'body': 'Concurrent write.'})
+            status = response.status_code
+            if status == 201:
+                response = client.delete(f"/api/reviews/{response.get_json()['id']}")
+                status = response.status_code
+            results.append(('write', time.perf_counter() - start, status))
+        else:
+            start = time.perf_counter()
+            response = client.get(rng.choice(READS).format(id=pokemon_id))
+            results.append(('read', time.perf_counter() - start, response.status_code))
+
+
+def run_profile(args):
+    with tempfile.TemporaryDirectory(prefix='pokeyelp-bench-') as workdir:
+        app, counts, _ = build_app(args, workdir)
+
+        from app.models import db
+        with app.app_context():
+            emails = db.session.execute(db.text(
+                "SELECT email FROM users WHERE email LIKE 'trainer%' ORDER BY id")).scalars().all()
+
+        results = []
+        deadline = time.perf_counter() + args.duration
+        threads = [threading.Thread(target=client_loop,
+                                    args=(app, emails[i % len(emails)], args, deadline, i, results))
+                   for i in range(args.threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with app.app_context():
+            db.engine.dispose()
+
+    report = {'profile': os.environ['DB_PROFILE'], 'dataset': counts}
+    for kind in ('read', 'write'):
+        timings = sorted(elapsed for name, elapsed, status in results if name == kind)
+        errors = sum(1 for name, elapsed, status in results if name == kind and status >= 400)
+        report[kind] = {
+            'requests': len(timings),
+            'errors': errors,
+            'p50_ms': round(percentile(timings, 0.50) * 1000, 3) if timings else None,
+            'p95_ms': round(percentile(timings, 0.95) * 1000, 3) if timings else None,
+            'mean_ms': round(statistics.mean(timings) * 1000, 3) if timings else None,
+        }
+    report['login_failures'] = sum(1 for name, *_ in results if name == 'login')
+    report['throughput_rps'] = round(sum(report[kind]['requests'] for kind in ('read', 'write'))
+                                     / args.duration, 2)
+    print(json.dumps(report))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark concurrent throughput per engine profile.')
+    parser.add_argument('--profiles', nargs='+', default=['default', 'sqlite'],
+                        help='DB_PROFILE values to compare, the first is the baseline.')
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=10, help='Seconds of load per profile.')
+    parser.add_argument('--write-ratio', type=float, default=0.1)
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--pokemon', type=int, default=2000)
+    parser.add_argument('--reviews-per-pokemon', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Also write the results to this JSON file.')
+    parser.add_argument('--run-profile', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_profile:
+        os.environ['DB_PROFILE'] = args.run_profile
+        os.environ['GUNICORN_THREADS'] = str(args.threads)
+        run_profile(args)
+        return
+
+    reports = []
+    for profile in args.profiles:
+        command = [sys.executable, os.path.abspath(__file__), '--run-profile', profile]
+        for option in ('threads', 'duration', 'write_ratio', 'users', 'pokemon',
+                       'reviews_per_pokemon', 'seed'):
+            command += [f"--{option.replace('_', '-')}", str(getattr(args, option))]
+        output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+        reports.append(json.loads(output.strip().splitlines()[-1]))
+
+    baseline = reports[0]['throughput_rps']
+    print(f"{'profile':<10} {'req/s':>9} {'gain':>7} {'read p50':>9} {'read p95':>9} "
+          f"{'write p95':>10} {'errors':>7}")
+    for report in reports:
+        errors = report['read']['errors'] + report['write']['errors'] + report['login_failures']
+        report['gain'] = round(report['throughput_rps'] / baseline, 2) if baseline else None
+        print(f"{report['profile']:<10} {report['throughput_rps']:>9} {report['gain']:>6}x "
+              f"{report['read']['p50_ms']:>9} {report['read']['p95_ms']:>9} "
+              f"{report['write']['p95_ms']:>10} {errors:>7}")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(reports, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
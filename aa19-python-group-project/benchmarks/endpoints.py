@@ -0,0 +1,227 @@
+"""
+Endpoint benchmarks for every API blueprint.
+
+Boots the Flask app in-process against a fresh SQLite database, migrates it,
+fills it with `flask seed synthetic` data of the requested size, and then
+times each scenario below through the test client. Per route it records
+throughput and p50/p95/p99 latency and writes everything to a JSON file.
+
+    python benchmarks/endpoints.py --pokemon 5000 --output bench.json
+    python benchmarks/endpoints.py --pokemon 5000 --compare bench.json
+
+With --compare, any route whose p95 latency grew, or whose throughput
+dropped, by more than --threshold (default 20%) against the baseline file
+fails the run with exit status 1.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def build_app(args, workdir):
+    """
+    The app on a database in workdir, migrated and seeded. The caller owns
+    workdir and removes it when done, e.g. a tempfile.TemporaryDirectory.
+    """
+    # Configure the app before it is imported, it reads the environment once
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ.setdefault('SECRET_KEY', 'benchmark')
+    # One log line per request would dominate the timings, opt in explicitly
+    os.environ.setdefault('REQUEST_TIMING_SAMPLE_RATE', '0')
+    sys.path.insert(0, ROOT)
+
+    from flask_migrate import upgrade
+    from app import app
+    from app.models import db
+    from app.seeds.synthetic import seed_synthetic
+
+    with app.app_context():
+        upgrade(directory=os.path.join(ROOT, 'migrations'))
+        counts = seed_synthetic(args.users, args.pokemon, args.reviews_per_pokemon, seed=args.seed)
+        first_user = db.session.execute(db.text(
+            "SELECT email FROM users WHERE email LIKE 'trainer%' ORDER BY id LIMIT 1")).scalar()
+    return app, counts, first_user
+
+
+def scenarios(pokemon_count, email):
+    """
+    (name, method, path, json body) for each route. Write scenarios come in
+    create / update / delete triples so the dataset stays the same size.
+    Paths and bodies may be callables taking the state dict, which holds the
+    iteration and the ids created by earlier steps. Signing up can't be
+    undone, so it adds one user per iteration, named after the iteration.
+    The auth steps run last and finish logged back in as email.
+    """
+    middle = max(1, pokemon_count // 2)
+    return [
+        ('auth.authenticate', 'GET', '/api/auth/', None),
+        ('pokemon.list', 'GET', '/api/pokemon/', None),
+        ('pokemon.list_summary', 'GET', '/api/pokemon/?view=summary&limit=100', None),
+        ('pokemon.list_filtered', 'GET', '/api/pokemon/?type=fire&region=kanto', None),
+        ('pokemon.facets', 'GET', '/api/pokemon/facets', None),
+        ('pokemon.detail', 'GET', f'/api/pokemon/{middle}', None),
+        ('pokemon.create', 'POST', '/api/pokemon/',
+         {'name': 'Benchmark', 'type': 'fire', 'region': 'kanto', 'category': 'Timing',
+          'description': 'Timing the Pokemon write path.', 'image_url': 'https://example.com/bench.png'}),
+        ('pokemon.update', 'PATCH', lambda state: f"/api/pokemon/{state['pokemon.create']}",
+         {'name': 'Benchmark', 'type': 'water', 'region': 'johto', 'category': 'Timing',
+          'description': 'Updated.'}),
+        ('pokemon.delete', 'DELETE', lambda state: f"/api/pokemon/{state['pokemon.create']}", None),
+        ('reviews.for_pokemon', 'GET', f'/api/reviews/pokemon/{middle}/reviews', None),
+        ('reviews.create', 'POST', f'/api/reviews/pokemon/{middle}/reviews',
+         {'rating': 4, 'title': 'Benchmark', 'body': 'Timing the review write path.'}),
+        ('reviews.detail', 'GET', lambda state: f"/api/reviews/{state['reviews.create']}", None),
+        ('reviews.update', 'PATCH', lambda state: f"/api/reviews/{state['reviews.create']}",
+         {'rating': 2, 'title': 'Benchmark', 'body': 'Updated.'}),
+        ('reviews.delete', 'DELETE', lambda state: f"/api/reviews/{state['reviews.create']}", None),
+        ('lists.list', 'GET', '/api/lists/', None),
+        ('lists.create', 'POST', '/api/lists/', {'name': 'Benchmark', 'description': 'Timing'}),
+        ('lists.detail', 'GET', lambda state: f"/api/lists/{state['lists.create']}", None),
+        ('lists.update', 'PATCH', lambda state: f"/api/lists/{state['lists.create']}",
+         {'name': 'Benchmark', 'description': 'Updated'}),
+        ('lists.bulk_add', 'POST', lambda state: f"/api/lists/{state['lists.create']}/pokemon",
+         {'pokemon_ids': list(range(1, 51))}),
+        ('lists.delete', 'DELETE', lambda state: f"/api/lists/{state['lists.create']}", None),
+        ('images.list', 'GET', '/api/images/', None),
+        ('images.for_pokemon', 'GET', f'/api/images/pokemon/{middle}', None),
+        ('images.create', 'POST', f'/api/images/pokemon/{middle}',
+         {'url': 'https://example.com/bench.png', 'caption': 'Benchmark'}),
+        ('images.update', 'PATCH', lambda state: f"/api/images/{state['images.create']}",
+         {'url': 'https://example.com/bench-2.png', 'caption': 'Updated'}),
+        ('images.delete', 'DELETE', lambda state: f"/api/images/{state['images.create']}", None),
+        ('users.list', 'GET', '/api/users/', None),
+        ('users.detail', 'GET', '/api/users/1', None),
+        ('search', 'GET', '/api/search?q=fire', None),
+        ('auth.demo', 'POST', '/api/auth/demo', None),
+        ('auth.logout', 'GET', '/api/auth/logout', None),
+        ('auth.signup', 'POST', '/api/auth/signup', lambda state: {
+            'username': f"bench{state['iteration']}",
+            'email': f"bench{state['iteration']}@bench.io",
+            'password': 'password'}),
+        ('auth.login', 'POST', '/api/auth/login', {'email': email, 'password': 'password'}),
+    ]
+
+
+def percentile(sorted_timings, fraction):
+    index = min(len(sorted_timings) - 1, int(round(fraction * (len(sorted_timings) - 1))))
+    return sorted_timings[index]
+
+
+def run(app, email, pokemon_count, requests, warmup):
+    client = app.test_client()
+    client.get('/api/auth/')  # sets the csrf_token cookie
+    response = client.post('/api/auth/login', json={'email': email, 'password': 'password'})
+    if response.status_code != 200:
+        raise SystemExit(f'Could not log in as {email}: {response.get_json()}')
+
+    steps = scenarios(pokemon_count, email)
+    timings = {name: [] for name, *_ in steps}
+    for iteration in range(warmup + requests):
+        state = {'iteration': iteration}
+        for name, method, path, body in steps:
+            url = path(state) if callable(path) else path
+            if callable(body):
+                body = body(state)
+            start = time.perf_counter()
+            response = client.open(url, method=method, json=body)
+            elapsed = time.perf_counter() - start
+            if response.status_code >= 400:
+                raise SystemExit(f'{name}: {method} {url} returned {response.status_code}')
+            if method == 'POST' and response.is_json and 'id' in response.get_json():
+                state[name] = response.get_json()['id']
+            if iteration >= warmup:
+                timings[name].append(elapsed)
+
+    results = {}
+    for name, samples in timings.items():
+        samples.sort()
+        results[name] = {
+            'requests': len(samples),
+            'throughput_rps': round(len(samples) / sum(samples), 2),
+            'mean_ms': round(statistics.mean(samples) * 1000, 3),
+            'p50_ms': round(percentile(samples, 0.50) * 1000, 3),
+            'p95_ms': round(percentile(samples, 0.95) * 1000, 3),
+            'p99_ms': round(percentile(samples, 0.99) * 1000, 3),
+        }
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Returns a list of regression messages, empty when every route is within
+    threshold of the baseline
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if current['p95_ms'] > previous['p95_ms'] * (1 + threshold):
+            regressions.append(f"{name}: p95 {previous['p95_ms']}ms -> {current['p95_ms']}ms")
+        if current['throughput_rps'] < previous['throughput_rps'] * (1 - threshold):
+            regressions.append(f"{name}: throughput {previous['throughput_rps']} -> "
+                               f"{current['throughput_rps']} req/s")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark every API route.')
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--pokemon', type=int, default=2000)
+    parser.add_argument('--reviews-per-pokemon', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--requests', type=int, default=200, help='Timed requests per route.')
+    parser.add_argument('--warmup', type=int, default=20, help='Untimed requests per route first.')
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--compare', metavar='BASELINE', help='Baseline results JSON to compare with.')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Allowed regression as a fraction, 0.2 is 20%%.')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='pokeyelp-bench-') as workdir:
+        app, counts, email = build_app(args, workdir)
+        results = run(app, email, args.pokemon, args.requests, args.warmup)
+        from app.models import db
+        with app.app_context():
+            db.engine.dispose()
+    report = {
+        'meta': {
+            'timestamp': datetime.utcnow().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'dataset': counts,
+            'requests_per_route': args.requests,
+        },
+        'routes': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"{'route':<24} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, result in results.items():
+        print(f"{name:<24} {result['throughput_rps']:>9} {result['p50_ms']:>9} "
+              f"{result['p95_ms']:>9} {result['p99_ms']:>9}")
+    print(f'Results written to {args.output}')
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['routes']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f'Regressions beyond {args.threshold:.0%}:')
+            for regression in regressions:
+                print(f'  {regression}')
+            sys.exit(1)
+        print(f'No route regressed beyond {args.threshold:.0%} of {args.compare}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Per-Pokemon lookup latency with and without the foreign key indexes.
+
+Builds a throwaway SQLite reviews table at each size, times lookups by
+pokemon_id on the bare table, then again after creating ix_reviews_pokemon_id.
+Unindexed lookups scan the whole table, so they grow with it; indexed lookups
+stay roughly flat.
+
+    python benchmarks/index_lookups.py --sizes 1000 10000 100000 1000000
+"""
+import argparse
+import random
+import sqlite3
+import statistics
+import time
+
+
+def build(size, reviews_per_pokemon):
+    conn = sqlite3.connect(':memory:')
+    conn.execute("""
+        CREATE TABLE reviews (
+            id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, pokemon_id INTEGER NOT NULL,
+            rating INTEGER NOT NULL, title VARCHAR(255), body TEXT
+        )
+    """)
+    pokemon_count = max(1, size // reviews_per_pokemon)
+    rng = random.Random(size)
+    conn.executemany(
+        "INSERT INTO reviews (user_id, pokemon_id, rating, title, body) VALUES (?, ?, ?, ?, ?)",
+        ((rng.randrange(1000), rng.randrange(pokemon_count), rng.randint(1, 5), 'title', 'body')
+         for _ in range(size)))
+    conn.commit()
+    return conn, pokemon_count
+
+
+def time_lookups(conn, pokemon_count, lookups):
+    rng = random.Random(0)
+    timings = []
+    for _ in range(lookups):
+        pokemon_id = rng.randrange(pokemon_count)
+        start = time.perf_counter()
+        conn.execute("SELECT * FROM reviews WHERE pokemon_id = ?", (pokemon_id,)).fetchall()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--reviews-per-pokemon', type=int, default=10)
+    parser.add_argument('--lookups', type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'no index (ms)':>14} {'indexed (ms)':>13} {'speedup':>8}")
+    for size in args.sizes:
+        conn, pokemon_count = build(size, args.reviews_per_pokemon)
+        unindexed = time_lookups(conn, pokemon_count, args.lookups)
+        conn.execute("CREATE INDEX ix_reviews_pokemon_id ON reviews (pokemon_id)")
+        indexed = time_lookups(conn, pokemon_count, args.lookups)
+        print(f"{size:>10} {unindexed:>14.3f} {indexed:>13.3f} {unindexed / indexed:>7.1f}x")
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Login throughput for one worker.
+
+Boots the app like benchmarks/endpoints.py, with synthetic users hashed by
+the current PASSWORD_HASH_METHOD, and logs in repeatedly through the test
+client. Reports logins per second, latency percentiles and the queries each
+login runs. Password hashing dominates a login, so this is the number to
+check before changing PASSWORD_HASH_METHOD:
+
+    PASSWORD_HASH_METHOD=pbkdf2:sha256:600000 python benchmarks/login.py
+
+With --stale-hashes the users are stored with a cheaper hash than the
+configured one, so the first login of each user also pays for the rehash.
+"""
+import argparse
+import json
+import statistics
+import tempfile
+import time
+
+from endpoints import build_app, percentile
+
+
+def run(args, workdir):
+    app, _, _ = build_app(args, workdir)
+
+    from sqlalchemy import event
+    from werkzeug.security import generate_password_hash
+    from app.models import db
+
+    with app.app_context():
+        if args.stale_hashes:
+            stale = generate_password_hash('password', 'pbkdf2:sha256:1000', 8)
+            db.session.execute(db.text('UPDATE users SET hashed_password = :hash'), {'hash': stale})
+            db.session.commit()
+        emails = db.session.execute(db.text(
+            "SELECT email FROM users WHERE email LIKE 'trainer%' ORDER BY id")).scalars().all()
+        engine = db.engine
+
+    queries = []
+    event.listen(engine, 'before_cursor_execute', lambda *args: queries.append(1))
+
+    client = app.test_client()
+    client.get('/api/auth/')  # sets the csrf_token cookie
+    timings = []
+    query_counts = []
+    for i in range(args.logins):
+        queries.clear()
+        start = time.perf_counter()
+        response = client.post('/api/auth/login', json={'email': emails[i % len(emails)],
+                                                         'password': 'password'})
+        timings.append(time.perf_counter() - start)
+        query_counts.append(len(queries))
+        if response.status_code != 200:
+            raise SystemExit(f'Login failed: {response.get_json()}')
+        client.get('/api/auth/logout')
+
+    timings.sort()
+    results = {
+        'hash_method': app.config['PASSWORD_HASH_METHOD'],
+        'stale_hashes': args.stale_hashes,
+        'logins': args.logins,
+        'logins_per_second': round(len(timings) / sum(timings), 2),
+        'mean_ms': round(statistics.mean(timings) * 1000, 3),
+        'p50_ms': round(percentile(timings, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(timings, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(timings, 0.99) * 1000, 3),
+        'queries_per_login': round(statistics.mean(query_counts), 2),
+    }
+    engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark logins per second on one worker.')
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--logins', type=int, default=200)
+    parser.add_argument('--stale-hashes', action='store_true',
+                        help='Store every user with an outdated hash first.')
+    parser.add_argument('--output', help='Also write the results to this JSON file.')
+    args = parser.parse_args()
+    args.pokemon = args.reviews_per_pokemon = args.seed = 0
+
+    with tempfile.TemporaryDirectory(prefix='pokeyelp-bench-') as workdir:
+        results = run(args, workdir)
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
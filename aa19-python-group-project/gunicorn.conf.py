@@ -0,0 +1,23 @@
+# gunicorn loads this file from the working directory on startup
+import os
+import shutil
+
+# Workers and threads per worker. The app sizes each worker's connection
+# pool from the same variables, see app/engine_profiles.py.
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 1))
+
+# Workers share Prometheus samples through this directory, see app/metrics.py
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', '/tmp/prometheus_multiproc')
+
+
+def on_starting(server):
+    # Files left over from a previous run would be merged into the new totals
+    directory = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
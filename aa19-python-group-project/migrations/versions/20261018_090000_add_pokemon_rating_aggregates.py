@@ -0,0 +1,50 @@
+"""Add rating aggregates to pokemon
+
+Revision ID: 3c9f1a7d2b64
+Revises: 7e97db0b584b
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c9f1a7d2b64'
+down_revision = '7e97db0b584b'
+branch_labels = None
+depends_on = None
+
+
+COUNTER_COLUMNS = ['review_count', 'rating_sum', 'rating_1_count', 'rating_2_count',
+                   'rating_3_count', 'rating_4_count', 'rating_5_count']
+
+
+def upgrade():
+    with op.batch_alter_table('pokemon', schema=None) as batch_op:
+        for column in COUNTER_COLUMNS:
+            batch_op.add_column(sa.Column(column, sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('average_rating', sa.Float(), nullable=True))
+        batch_op.create_index('ix_pokemon_review_count', ['review_count'], unique=False)
+        batch_op.create_index('ix_pokemon_average_rating', ['average_rating'], unique=False)
+
+    # Backfill from the existing reviews
+    per_pokemon = "(SELECT {} FROM reviews WHERE reviews.pokemon_id = pokemon.id)"
+    assignments = [
+        f"review_count = {per_pokemon.format('COUNT(*)')}",
+        f"rating_sum = {per_pokemon.format('COALESCE(SUM(rating), 0)')}",
+        f"average_rating = {per_pokemon.format('CAST(AVG(rating) AS FLOAT)')}",
+    ]
+    for rating in range(1, 6):
+        assignments.append(
+            f"rating_{rating}_count = {per_pokemon.format(f'COUNT(CASE WHEN rating = {rating} THEN 1 END)')}")
+    op.execute(f"UPDATE pokemon SET {', '.join(assignments)}")
+
+
+def downgrade():
+    with op.batch_alter_table('pokemon', schema=None) as batch_op:
+        batch_op.drop_index('ix_pokemon_average_rating')
+        batch_op.drop_index('ix_pokemon_review_count')
+        batch_op.drop_column('average_rating')
+        for column in reversed(COUNTER_COLUMNS):
+            batch_op.drop_column(column)
@@ -0,0 +1,82 @@
+"""Add full text search over pokemon and reviews
+
+Revision ID: 5a0e8c4f91d3
+Revises: 3c9f1a7d2b64
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5a0e8c4f91d3'
+down_revision = '3c9f1a7d2b64'
+branch_labels = None
+depends_on = None
+
+
+POKEMON_COLUMNS = ['name', 'type', 'type_secondary', 'region', 'category', 'description']
+REVIEW_COLUMNS = ['title', 'body']
+
+
+def _sqlite_fts(table, columns):
+    # External content FTS5 table kept in step with its source table by
+    # triggers, so every writer (routes, seeds, raw SQL) updates the index
+    column_list = ', '.join(columns)
+    new_values = ', '.join(f'new.{column}' for column in columns)
+    old_values = ', '.join(f'old.{column}' for column in columns)
+    delete_old = (f"INSERT INTO {table}_fts({table}_fts, rowid, {column_list}) "
+                  f"VALUES ('delete', old.id, {old_values});")
+    insert_new = f"INSERT INTO {table}_fts(rowid, {column_list}) VALUES (new.id, {new_values});"
+
+    op.execute(f"CREATE VIRTUAL TABLE {table}_fts USING fts5({column_list}, "
+               f"content='{table}', content_rowid='id', tokenize='porter unicode61')")
+    op.execute(f"CREATE TRIGGER {table}_fts_insert AFTER INSERT ON {table} BEGIN {insert_new} END")
+    op.execute(f"CREATE TRIGGER {table}_fts_delete AFTER DELETE ON {table} BEGIN {delete_old} END")
+    # Only reindex when a searchable column changes, not on rating counter updates
+    op.execute(f"CREATE TRIGGER {table}_fts_update AFTER UPDATE OF {column_list} ON {table} "
+               f"BEGIN {delete_old} {insert_new} END")
+    op.execute(f"INSERT INTO {table}_fts({table}_fts) VALUES ('rebuild')")
+
+
+def _drop_sqlite_fts(table):
+    for trigger in ('insert', 'delete', 'update'):
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_fts_{trigger}")
+    op.execute(f"DROP TABLE IF EXISTS {table}_fts")
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        # Weighted, stored tsvector columns maintained by Postgres itself
+        op.execute("""
+            ALTER TABLE pokemon ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+                setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(type, '') || ' ' ||
+                                                 coalesce(type_secondary, '') || ' ' ||
+                                                 coalesce(region, '') || ' ' ||
+                                                 coalesce(category, '')), 'B') ||
+                setweight(to_tsvector('english', coalesce(description, '')), 'C')
+            ) STORED
+        """)
+        op.execute("""
+            ALTER TABLE reviews ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+                setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(body, '')), 'B')
+            ) STORED
+        """)
+        op.execute("CREATE INDEX ix_pokemon_search_vector ON pokemon USING GIN (search_vector)")
+        op.execute("CREATE INDEX ix_reviews_search_vector ON reviews USING GIN (search_vector)")
+    else:
+        _sqlite_fts('pokemon', POKEMON_COLUMNS)
+        _sqlite_fts('reviews', REVIEW_COLUMNS)
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_reviews_search_vector")
+        op.execute("DROP INDEX IF EXISTS ix_pokemon_search_vector")
+        op.execute("ALTER TABLE reviews DROP COLUMN search_vector")
+        op.execute("ALTER TABLE pokemon DROP COLUMN search_vector")
+    else:
+        _drop_sqlite_fts('reviews')
+        _drop_sqlite_fts('pokemon')
@@ -0,0 +1,36 @@
+"""Add pokemon facet indexes
+
+Revision ID: 8d2b6e0c7a15
+Revises: 5a0e8c4f91d3
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d2b6e0c7a15'
+down_revision = '5a0e8c4f91d3'
+branch_labels = None
+depends_on = None
+
+
+# The catalog filters compare lower(column) and page on id, so each index
+# leads with the lowered filter columns and ends with id
+INDEXES = {
+    'ix_pokemon_type_region': ['lower(type)', 'lower(region)', 'id'],
+    'ix_pokemon_type_secondary': ['lower(type_secondary)', 'id'],
+    'ix_pokemon_region_category': ['lower(region)', 'lower(category)', 'id'],
+    'ix_pokemon_category': ['lower(category)', 'id'],
+}
+
+
+def upgrade():
+    for name, columns in INDEXES.items():
+        op.create_index(name, 'pokemon', [sa.text(column) for column in columns], unique=False)
+
+
+def downgrade():
+    for name in reversed(list(INDEXES)):
+        op.drop_index(name, table_name='pokemon')
@@ -0,0 +1,37 @@
+"""Create table_versions
+
+Revision ID: b41f7e93c0a2
+Revises: 8d2b6e0c7a15
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from datetime import datetime
+
+
+# revision identifiers, used by Alembic.
+revision = 'b41f7e93c0a2'
+down_revision = '8d2b6e0c7a15'
+branch_labels = None
+depends_on = None
+
+
+TABLES = ['users', 'pokemon', 'reviews', 'images', 'lists', 'list_pokemon']
+
+
+def upgrade():
+    table_versions = op.create_table('table_versions',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    now = datetime.utcnow()
+    op.bulk_insert(table_versions, [
+        {'name': name, 'version': 1, 'updated_at': now} for name in TABLES
+    ])
+
+
+def downgrade():
+    op.drop_table('table_versions')
@@ -0,0 +1,50 @@
+"""Add foreign key indexes and list_pokemon uniqueness
+
+Revision ID: e6a3d9b27f48
+Revises: b41f7e93c0a2
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6a3d9b27f48'
+down_revision = 'b41f7e93c0a2'
+branch_labels = None
+depends_on = None
+
+
+FOREIGN_KEY_INDEXES = [
+    ('reviews', 'pokemon_id'),
+    ('reviews', 'user_id'),
+    ('images', 'pokemon_id'),
+    ('images', 'user_id'),
+    ('list_pokemon', 'pokemon_id'),
+    ('lists', 'user_id'),
+    ('pokemon', 'user_id'),
+]
+
+
+def upgrade():
+    # Keep the oldest row of every duplicated (list_id, pokemon_id) pair so
+    # the unique index can be built
+    op.execute("""
+        DELETE FROM list_pokemon
+        WHERE id NOT IN (
+            SELECT keep_id FROM (
+                SELECT MIN(id) AS keep_id FROM list_pokemon GROUP BY list_id, pokemon_id
+            ) AS keepers
+        )
+    """)
+    # Also serves lookups by list_id, its leading column
+    op.create_index('uq_list_pokemon_list_id_pokemon_id', 'list_pokemon',
+                    ['list_id', 'pokemon_id'], unique=True)
+    for table, column in FOREIGN_KEY_INDEXES:
+        op.create_index(f'ix_{table}_{column}', table, [column], unique=False)
+
+
+def downgrade():
+    for table, column in reversed(FOREIGN_KEY_INDEXES):
+        op.drop_index(f'ix_{table}_{column}', table_name=table)
+    op.drop_index('uq_list_pokemon_list_id_pokemon_id', table_name='list_pokemon')
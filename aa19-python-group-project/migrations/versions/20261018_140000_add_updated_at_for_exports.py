@@ -0,0 +1,33 @@
+"""Add updated_at to pokemon and images for incremental exports
+
+Revision ID: c58f2a1d9e07
+Revises: e6a3d9b27f48
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c58f2a1d9e07'
+down_revision = 'e6a3d9b27f48'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Plain ALTER TABLE rather than batch mode: rebuilding pokemon on SQLite
+    # would drop its full text search triggers
+    for table in ('pokemon', 'images'):
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(), nullable=True))
+        op.execute(f"UPDATE {table} SET updated_at = created_at")
+    for table in ('pokemon', 'images', 'reviews'):
+        op.create_index(f'ix_{table}_updated_at', table, ['updated_at'], unique=False)
+
+
+def downgrade():
+    for table in ('reviews', 'images', 'pokemon'):
+        op.drop_index(f'ix_{table}_updated_at', table_name=table)
+    for table in ('images', 'pokemon'):
+        op.drop_column(table, 'updated_at')
@@ -0,0 +1,95 @@
+"""Cascade deletes through the foreign keys
+
+Revision ID: 7d2b9c4e1f60
+Revises: c58f2a1d9e07
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+import os
+import warnings
+environment = os.getenv("FLASK_ENV")
+SCHEMA = os.environ.get("SCHEMA")
+
+
+# revision identifiers, used by Alembic.
+revision = '7d2b9c4e1f60'
+down_revision = 'c58f2a1d9e07'
+branch_labels = None
+depends_on = None
+
+
+# (table, column, referred table) for every foreign key that cascades
+FOREIGN_KEYS = [
+    ('pokemon', 'user_id', 'users'),
+    ('reviews', 'user_id', 'users'),
+    ('reviews', 'pokemon_id', 'pokemon'),
+    ('images', 'user_id', 'users'),
+    ('images', 'pokemon_id', 'pokemon'),
+    ('lists', 'user_id', 'users'),
+    ('list_pokemon', 'list_id', 'lists'),
+    ('list_pokemon', 'pokemon_id', 'pokemon'),
+]
+
+# The foreign keys were created unnamed; SQLite batch mode needs a name to
+# find them by
+NAMING_CONVENTION = {'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s'}
+
+
+def _postgres_foreign_keys(ondelete):
+    schema = SCHEMA if environment == "production" else None
+    inspector = sa.inspect(op.get_bind())
+    for table, column, referred in FOREIGN_KEYS:
+        name = next(fk['name'] for fk in inspector.get_foreign_keys(table, schema=schema)
+                    if fk['constrained_columns'] == [column])
+        op.drop_constraint(name, table, type_='foreignkey', schema=schema)
+        op.create_foreign_key(name, table, referred, [column], ['id'], ondelete=ondelete,
+                              source_schema=schema, referent_schema=schema)
+
+
+def _sqlite_foreign_keys(ondelete):
+    # SQLite can't alter a constraint, so each table is rebuilt. The rebuild
+    # loses the full text search triggers and the lower() expression indexes,
+    # which reflection doesn't copy, so they're saved and put back after.
+    bind = op.get_bind()
+    tables = {}
+    for table, column, referred in FOREIGN_KEYS:
+        tables.setdefault(table, []).append((column, referred))
+
+    for table, foreign_keys in tables.items():
+        saved = bind.execute(sa.text(
+            "SELECT name, sql FROM sqlite_master "
+            "WHERE tbl_name = :table AND type IN ('index', 'trigger') AND sql IS NOT NULL"),
+            {'table': table}).fetchall()
+
+        with warnings.catch_warnings():
+            # Reflection skipping the expression indexes; they come back below
+            warnings.filterwarnings('ignore', 'Skipped unsupported reflection')
+            with op.batch_alter_table(table, recreate='always',
+                                      naming_convention=NAMING_CONVENTION) as batch_op:
+                for column, referred in foreign_keys:
+                    name = f'fk_{table}_{column}_{referred}'
+                    batch_op.drop_constraint(name, type_='foreignkey')
+                    batch_op.create_foreign_key(name, referred, [column], ['id'], ondelete=ondelete)
+
+        existing = set(bind.execute(sa.text(
+            "SELECT name FROM sqlite_master WHERE tbl_name = :table"), {'table': table}).scalars())
+        for name, sql in saved:
+            if name not in existing:
+                op.execute(sql)
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        _postgres_foreign_keys('CASCADE')
+    else:
+        _sqlite_foreign_keys('CASCADE')
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        _postgres_foreign_keys(None)
+    else:
+        _sqlite_foreign_keys(None)
@@ -16,19 +16,12 @@ const LandingPage = () => {
 
   const fetchPokemonData = async () => {
     try {
-      const response = await fetch('/api/pokemon/');
+      const response = await fetch('/api/pokemon/?all=true&view=summary');
       if (!response.ok) {
         throw new Error('Failed to fetch Pokémon data');
       }
       const data = await response.json();
-      const pokemonList = data.pokemon || [];
-      
-      const pokemonWithReviews = pokemonList.map(pokemon => ({
-        ...pokemon,
-        reviews: pokemon.reviews || []
-      }));
-      
-      setPokemonData(pokemonWithReviews);
+      setPokemonData(data.pokemon || []);
       setLoading(false);
     } catch (err) {
       console.error('Error fetching Pokémon:', err);
@@ -41,14 +34,8 @@ const LandingPage = () => {
     navigate(`/pokemon/${pokemonId}`);
   };
 
-  const calculateAverageRating = (reviews) => {
-    if (!reviews || reviews.length === 0) return 0;
-    const totalRating = reviews.reduce((sum, review) => sum + review.rating, 0);
-    return Math.round((totalRating / reviews.length) * 10) / 10;
-  };
-
-  const getReviewCount = (reviews) => {
-    return reviews ? reviews.length : 0;
+  const roundRating = (rating) => {
+    return rating ? Math.round(rating * 10) / 10 : 0;
   };
 
   const renderStars = (rating) => {
@@ -103,8 +90,8 @@ const LandingPage = () => {
         <section className="pokemon-grid">
           <div className="pokemon-cards">
             {pokemonData.map(pokemon => {
-              const averageRating = calculateAverageRating(pokemon.reviews);
-              const reviewCount = getReviewCount(pokemon.reviews);
+              const averageRating = roundRating(pokemon.average_rating);
+              const reviewCount = pokemon.review_count || 0;
               
               return (
                 <div 
@@ -114,7 +101,7 @@ const LandingPage = () => {
                   style={{ cursor: 'pointer' }}
                 >
                   <img 
-                    src={pokemon.images && pokemon.images.length > 0 ? pokemon.images[0].url : 'https://example.com/image.jpg'} 
+                    src={pokemon.thumbnail || 'https://example.com/image.jpg'} 
                     alt={pokemon.name} 
                     className="pokemon-image"
                   />
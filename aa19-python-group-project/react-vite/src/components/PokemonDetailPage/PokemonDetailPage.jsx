@@ -13,6 +13,7 @@ const PokemonDetailPage = () => {
   const [pokemon, setPokemon] = useState(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     fetchPokemonDetails();
@@ -20,7 +21,8 @@ const PokemonDetailPage = () => {
 
   const fetchPokemonDetails = async () => {
     try {
-      const response = await fetch(`/api/pokemon/${id}`);
+      // One request for the Pokemon, its first page of reviews and its images
+      const response = await fetch(`/api/pokemon/${id}/detail`);
       if (!response.ok) {
         throw new Error('Failed to fetch Pokémon details');
       }
@@ -34,10 +36,24 @@ const PokemonDetailPage = () => {
     }
   };
 
-  const calculateAverageRating = (reviews) => {
-    if (!reviews || reviews.length === 0) return 0;
-    const totalRating = reviews.reduce((sum, review) => sum + review.rating, 0);
-    return Math.round((totalRating / reviews.length) * 10) / 10;
+  const loadMoreReviews = async () => {
+    setLoadingMore(true);
+    try {
+      const response = await fetch(`/api/pokemon/${id}/detail?after=${pokemon.next_cursor}`);
+      if (!response.ok) {
+        throw new Error('Failed to load more reviews');
+      }
+      const data = await response.json();
+      setPokemon(prevPokemon => ({
+        ...prevPokemon,
+        reviews: [...prevPokemon.reviews, ...data.reviews],
+        next_cursor: data.next_cursor
+      }));
+    } catch (err) {
+      console.error('Error loading reviews:', err);
+      alert(err.message);
+    }
+    setLoadingMore(false);
   };
 
   const renderStars = (rating) => {
@@ -76,11 +92,8 @@ const PokemonDetailPage = () => {
         throw new Error(errorData.error || 'Failed to delete review');
       }
 
-      // Remove the deleted review from the pokemon state
-      setPokemon(prevPokemon => ({
-        ...prevPokemon,
-        reviews: prevPokemon.reviews.filter(review => review.id !== reviewId)
-      }));
+      // Reload so the rating totals reflect the deleted review
+      fetchPokemonDetails();
 
     } catch (err) {
       console.error('Error deleting review:', err);
@@ -145,8 +158,8 @@ const PokemonDetailPage = () => {
     );
   }
 
-  const averageRating = calculateAverageRating(pokemon.reviews);
-  const reviewCount = pokemon.reviews ? pokemon.reviews.length : 0;
+  const averageRating = Math.round((pokemon.average_rating || 0) * 10) / 10;
+  const reviewCount = pokemon.review_count;
 
   return (
     <div className="pokemon-detail-page">
@@ -231,6 +244,9 @@ const PokemonDetailPage = () => {
               <div key={review.id} className="review-card">
                 <div className="review-header">
                   <div className="review-meta">
+                    <p>
+                      <strong>{review.username}</strong>
+                    </p>
                     <p>
                       <strong>Rating:</strong> {renderStars(review.rating)} 
                       <span style={{marginLeft: '10px', color: '#888', fontSize: '12px'}}>
@@ -266,6 +282,16 @@ const PokemonDetailPage = () => {
           ) : (
             <p className="no-reviews">No reviews yet. Be the first to review this Pokémon!</p>
           )}
+
+          {pokemon.next_cursor && (
+            <button
+              className="load-more-reviews-button"
+              onClick={loadMoreReviews}
+              disabled={loadingMore}
+            >
+              {loadingMore ? 'Loading...' : 'Load more reviews'}
+            </button>
+          )}
         </div>
       </div>
     </div>
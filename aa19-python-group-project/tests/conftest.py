@@ -0,0 +1,73 @@
+import itertools
+import os
+import tempfile
+import pytest
+
+# The app reads its config at import, so point it at a throwaway SQLite
+# database before anything imports it
+_workdir = tempfile.TemporaryDirectory(prefix='pokeyelp-tests-')
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_workdir.name, 'test.db')}"
+os.environ.setdefault('SECRET_KEY', 'test')
+os.environ['REQUEST_TIMING_SAMPLE_RATE'] = '0'
+
+from flask_migrate import upgrade
+from app import app as flask_app
+from app.models import db
+
+_user_numbers = itertools.count(1)
+
+MIGRATIONS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+
+@pytest.fixture(scope='session')
+def app():
+    with flask_app.app_context():
+        upgrade(directory=MIGRATIONS)
+    yield flask_app
+    with flask_app.app_context():
+        for engine in db.engines.values():
+            engine.dispose()
+    _workdir.cleanup()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def auth_client(app):
+    """
+    A test client signed up and logged in as a new user, with the
+    csrf_token cookie the forms check
+    """
+    client = app.test_client()
+    client.get('/api/auth/')
+    number = next(_user_numbers)
+    response = client.post('/api/auth/signup', json={
+        'username': f'tester{number}', 'email': f'tester{number}@test.pokeyelp.io',
+        'password': 'password'})
+    assert response.status_code == 200, response.get_json()
+    return client
+
+
+@pytest.fixture
+def make_pokemon(auth_client):
+    """
+    Creates Pokemon through the API as auth_client's user, returns the id
+    """
+    def make(**fields):
+        body = {'name': 'Testmon', 'type': 'fire', 'region': 'kanto', **fields}
+        response = auth_client.post('/api/pokemon/', json=body)
+        assert response.status_code == 201, response.get_json()
+        return response.get_json()['id']
+    return make
+
+
+@pytest.fixture
+def make_list(auth_client):
+    def make(name='Favourites'):
+        response = auth_client.post('/api/lists/', json={'name': name, 'description': ''})
+        assert response.status_code == 201, response.get_json()
+        return response.get_json()['id']
+    return make
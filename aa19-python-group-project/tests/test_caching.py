@@ -0,0 +1,44 @@
+"""
+ETags on read routes: a repeat request with the ETag gets a 304 until a
+write changes one of the tables the route reads.
+"""
+
+
+def revalidate(client, url, etag):
+    return client.get(url, headers={'If-None-Match': etag})
+
+
+def test_unchanged_resource_is_304(client, make_pokemon):
+    url = f'/api/pokemon/{make_pokemon()}'
+    etag = client.get(url).headers['ETag']
+    assert revalidate(client, url, etag).status_code == 304
+
+
+def test_writes_invalidate_etags(auth_client, make_pokemon):
+    pokemon_id = make_pokemon()
+    detail = f'/api/pokemon/{pokemon_id}'
+    reviews = f'/api/reviews/pokemon/{pokemon_id}/reviews'
+    review = {'rating': 3, 'title': 'Fine', 'body': 'Perfectly average.'}
+
+    steps = [
+        (lambda: auth_client.patch(detail, json={'name': 'Renamed', 'type': 'water'}), [detail]),
+        (lambda: auth_client.post(reviews, json=review), [detail, reviews]),
+        (lambda: auth_client.post(f'/api/images/pokemon/{pokemon_id}',
+                                  json={'url': 'https://example.com/a.png'}), [detail]),
+    ]
+    etags = {url: auth_client.get(url).headers['ETag'] for url in (detail, reviews)}
+    for write, urls in steps:
+        assert write().status_code in (200, 201)
+        for url in urls:
+            response = revalidate(auth_client, url, etags[url])
+            assert response.status_code == 200, url
+            etags[url] = response.headers['ETag']
+
+
+def test_delete_invalidates_etag(auth_client, make_pokemon):
+    pokemon_id = make_pokemon()
+    etag = auth_client.get('/api/pokemon/?view=summary').headers['ETag']
+    assert auth_client.delete(f'/api/pokemon/{pokemon_id}').status_code == 200
+    response = revalidate(auth_client, '/api/pokemon/?view=summary', etag)
+    assert response.status_code == 200
+    assert pokemon_id not in [p['id'] for p in response.get_json()['pokemon']]
@@ -0,0 +1,53 @@
+"""
+Bulk import of Pokemon from NDJSON and CSV, where bad rows are reported
+and the rest are saved.
+"""
+import json
+
+
+def import_catalog(client, body, format):
+    return client.post(f'/api/pokemon/import?format={format}', data=body,
+                       content_type='text/csv' if format == 'csv' else 'application/x-ndjson')
+
+
+def row_errors(response):
+    return {error['row']: error['errors'] for error in response.get_json()['errors']}
+
+
+def test_ndjson_import_reports_bad_rows(auth_client):
+    lines = [
+        json.dumps({'name': 'Importmon', 'type': 'grass', 'image_url': 'https://example.com/i.png'}),
+        '{not json',
+        '',
+        '[1, 2]',
+        json.dumps({'name': 'Typeless'}),
+        json.dumps({'name': 'Badurl', 'type': 'fire', 'image_url': 'not a url'}),
+        json.dumps({'name': 'Importmon 2', 'type': 'water'}),
+    ]
+    response = import_catalog(auth_client, '\n'.join(lines), 'ndjson')
+    assert response.status_code == 201
+    assert response.get_json()['created'] == 2
+    errors = row_errors(response)
+    assert sorted(errors) == [2, 4, 5, 6]
+    assert 'type' in errors[5] and 'image_url' in errors[6]
+
+
+def test_csv_import_reports_bad_rows(auth_client):
+    body = 'name,type,region\nCsvmon,rock,johto\n,ghost,\nCsvmon 2,ice,\n'
+    response = import_catalog(auth_client, body, 'csv')
+    assert response.status_code == 201
+    assert response.get_json()['created'] == 2
+    assert list(row_errors(response)) == [2]
+
+
+def test_nothing_valid_is_200_with_errors(auth_client):
+    response = import_catalog(auth_client, '{"name": "Typeless"}\n', 'ndjson')
+    assert response.status_code == 200
+    assert response.get_json()['created'] == 0
+    assert list(row_errors(response)) == [1]
+
+
+def test_unknown_format_is_400(auth_client):
+    response = auth_client.post('/api/pokemon/import?format=xml', data='<pokemon/>')
+    assert response.status_code == 400
+    assert 'format' in response.get_json()['errors']
@@ -0,0 +1,55 @@
+"""
+Adding and removing Pokemon in bulk, and the list ETags those writes must
+invalidate.
+"""
+
+
+def test_bulk_writes_invalidate_list_etag(auth_client, make_pokemon, make_list):
+    list_id = make_list()
+    pokemon_ids = [make_pokemon(), make_pokemon()]
+    first = auth_client.get(f'/api/lists/{list_id}')
+    etag = first.headers['ETag']
+
+    writes = [
+        ('POST', f'/api/lists/{list_id}/pokemon', {'pokemon_ids': pokemon_ids}),
+        ('DELETE', f'/api/lists/{list_id}/pokemon', {'pokemon_ids': pokemon_ids[:1]}),
+        ('POST', f'/api/lists/{list_id}/pokemon/{pokemon_ids[0]}', None),
+    ]
+    for method, url, body in writes:
+        assert auth_client.open(url, method=method, json=body).status_code in (200, 201)
+        response = auth_client.get(f'/api/lists/{list_id}', headers={'If-None-Match': etag})
+        assert response.status_code == 200, f'{method} {url} left the list ETag stale'
+        etag = response.headers['ETag']
+
+
+def statuses(response):
+    return {result['pokemon_id']: result['status'] for result in response.get_json()['results']}
+
+
+def test_bulk_add_and_remove_outcomes(auth_client, make_pokemon, make_list):
+    list_id = make_list()
+    first, second, third = make_pokemon(), make_pokemon(), make_pokemon()
+    url = f'/api/lists/{list_id}/pokemon'
+
+    response = auth_client.post(url, json={'pokemon_ids': [first, second, first, 999999]})
+    assert statuses(response) == {first: 'added', second: 'added', 999999: 'not_found'}
+
+    response = auth_client.post(url, json={'pokemon_ids': [second, third]})
+    assert statuses(response) == {second: 'already_in_list', third: 'added'}
+
+    response = auth_client.delete(url, json={'pokemon_ids': [first, first, 999999]})
+    assert statuses(response) == {first: 'removed', 999999: 'not_found'}
+
+    response = auth_client.delete(url, json={'pokemon_ids': [first, second]})
+    assert statuses(response) == {first: 'not_in_list', second: 'removed'}
+
+    body = auth_client.get(f'/api/lists/{list_id}').get_json()
+    assert [entry['pokemon_id'] for entry in body['list_pokemon']] == [third]
+
+
+def test_bulk_requires_a_list_of_ids(auth_client, make_list):
+    url = f'/api/lists/{make_list()}/pokemon'
+    for body in ({}, {'pokemon_ids': []}, {'pokemon_ids': ['1']}, {'pokemon_ids': [True]}):
+        response = auth_client.post(url, json=body)
+        assert response.status_code == 400
+        assert 'pokemon_ids' in response.get_json()['errors']
@@ -0,0 +1,60 @@
+"""
+Keyset pagination of the collection endpoints and the 400s for a bad
+?limit= or ?after=.
+"""
+import pytest
+
+
+def test_pages_walk_every_row_once(auth_client, make_pokemon):
+    for _ in range(5):
+        make_pokemon()
+    every = [p['id'] for p in auth_client.get('/api/pokemon/?all=true&view=summary').get_json()['pokemon']]
+
+    seen, url = [], '/api/pokemon/?view=summary&limit=2'
+    while url:
+        body = auth_client.get(url).get_json()
+        assert len(body['pokemon']) <= 2
+        seen += [p['id'] for p in body['pokemon']]
+        cursor = body['next_cursor']
+        url = f'/api/pokemon/?view=summary&limit=2&after={cursor}' if cursor is not None else None
+    assert seen == sorted(every)
+
+
+def test_last_page_has_no_cursor(auth_client, make_pokemon):
+    newest = make_pokemon()
+    body = auth_client.get(f'/api/pokemon/?limit=5&after={newest - 1}').get_json()
+    assert [p['id'] for p in body['pokemon']] == [newest]
+    assert body['next_cursor'] is None
+
+
+def test_unpaginated_by_default_until_enabled(app, auth_client, make_pokemon):
+    for _ in range(21):
+        make_pokemon()
+    body = auth_client.get('/api/pokemon/').get_json()
+    assert len(body['pokemon']) > 20 and 'next_cursor' not in body
+
+    app.config['PAGINATE_BY_DEFAULT'] = True
+    try:
+        body = auth_client.get('/api/pokemon/').get_json()
+    finally:
+        app.config['PAGINATE_BY_DEFAULT'] = False
+    assert len(body['pokemon']) == 20 and body['next_cursor'] is not None
+
+
+@pytest.mark.parametrize('query, field', [
+    ('after=abc', 'after'),
+    ('after=1.5', 'after'),
+    ('limit=0', 'limit'),
+    ('limit=-3', 'limit'),
+    ('limit=ten', 'limit'),
+])
+def test_bad_cursor_or_limit_is_400(client, query, field):
+    for url in ('/api/pokemon/', '/api/lists/', '/api/images/', '/api/reviews/pokemon/1/reviews'):
+        response = client.get(f'{url}?{query}')
+        assert response.status_code == 400, url
+        assert field in response.get_json()['errors']
+
+
+def test_limit_is_capped(client):
+    body = client.get('/api/pokemon/?view=summary&limit=100000').get_json()
+    assert len(body['pokemon']) <= 100
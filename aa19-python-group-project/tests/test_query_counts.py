@@ -0,0 +1,78 @@
+"""
+The catalog endpoints load their relationships in a fixed number of
+statements. Each endpoint is requested on a small catalog and again after
+the catalog has grown, and must run the same number of statements both
+times. An N+1 query shows up as a count that grows with the catalog.
+"""
+import pytest
+from sqlalchemy import event, func
+from app.models import db, List, ListPokemon, Pokemon, User
+from app.seeds import seed_synthetic
+
+ENDPOINTS = [
+    '/api/pokemon/',
+    '/api/pokemon/?all=true',
+    '/api/pokemon/?view=summary&limit=50',
+    '/api/pokemon/{pokemon_id}',
+    '/api/pokemon/{pokemon_id}/detail',
+    '/api/lists/',
+    '/api/lists/{list_id}',
+]
+
+
+def count_statements(app, client, url):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    # Once without counting, so first-use caches don't skew the count
+    client.get(url)
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        response = client.get(url)
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+    assert response.status_code == 200, url
+    return len(statements)
+
+
+def grow_catalog(app, pokemon, reviews_per_pokemon, list_size):
+    """
+    Adds synthetic users, Pokemon and reviews, and a list holding the
+    list_size newest Pokemon. Returns the ids of that list and of the
+    newest Pokemon.
+    """
+    with app.app_context():
+        seed_synthetic(users=5, pokemon=pokemon, reviews_per_pokemon=reviews_per_pokemon)
+        pokemon_ids = db.session.execute(
+            db.select(Pokemon.id).order_by(Pokemon.id.desc()).limit(list_size)).scalars().all()
+        user_id = db.session.execute(db.select(func.max(User.id))).scalar()
+        list_item = List(name=f'Top {list_size}', description='Query count fixture', user_id=user_id)
+        db.session.add(list_item)
+        db.session.flush()
+        db.session.add_all(ListPokemon(list_id=list_item.id, pokemon_id=id) for id in pokemon_ids)
+        db.session.commit()
+        return {'list_id': list_item.id, 'pokemon_id': pokemon_ids[0]}
+
+
+@pytest.fixture(scope='module')
+def counts(app):
+    """
+    Statements per endpoint, on a small catalog and on one ten times its size
+    """
+    sizes = [(30, 2, 5), (300, 10, 100)]
+    results = []
+    for pokemon, reviews_per_pokemon, list_size in sizes:
+        ids = grow_catalog(app, pokemon, reviews_per_pokemon, list_size)
+        client = app.test_client()
+        results.append({url: count_statements(app, client, url.format(**ids)) for url in ENDPOINTS})
+    return results
+
+
+@pytest.mark.parametrize('url', ENDPOINTS)
+def test_statements_do_not_grow_with_catalog(counts, url):
+    small, large = counts
+    assert small[url] == large[url]
@@ -0,0 +1,36 @@
+"""
+Review writes and the rating aggregates kept on each Pokemon.
+"""
+
+REVIEW = {'rating': 4, 'title': 'Great', 'body': 'A fine Pokemon to train.'}
+
+
+def test_review_for_missing_pokemon_is_404(auth_client):
+    response = auth_client.post('/api/reviews/pokemon/999999/reviews', json=REVIEW)
+    assert response.status_code == 404
+    assert response.get_json() == {'errors': {'pokemon_id': 'Pokemon not found'}}
+
+
+def ratings(client, pokemon_id):
+    body = client.get(f'/api/pokemon/{pokemon_id}?fields=review_count,average_rating,rating_histogram').get_json()
+    return body['review_count'], body['average_rating'], body['rating_histogram']
+
+
+def test_rating_aggregates_follow_review_writes(auth_client, make_pokemon):
+    pokemon_id = make_pokemon()
+    assert ratings(auth_client, pokemon_id) == (0, None, {'1': 0, '2': 0, '3': 0, '4': 0, '5': 0})
+
+    first = auth_client.post(f'/api/reviews/pokemon/{pokemon_id}/reviews', json=REVIEW).get_json()
+    second = auth_client.post(f'/api/reviews/pokemon/{pokemon_id}/reviews',
+                              json={**REVIEW, 'rating': 2}).get_json()
+    assert ratings(auth_client, pokemon_id) == (2, 3.0, {'1': 0, '2': 1, '3': 0, '4': 1, '5': 0})
+
+    response = auth_client.patch(f"/api/reviews/{second['id']}", json={**REVIEW, 'rating': 5})
+    assert response.status_code == 200
+    assert ratings(auth_client, pokemon_id) == (2, 4.5, {'1': 0, '2': 0, '3': 0, '4': 1, '5': 1})
+
+    assert auth_client.delete(f"/api/reviews/{first['id']}").status_code == 200
+    assert ratings(auth_client, pokemon_id) == (1, 5.0, {'1': 0, '2': 0, '3': 0, '4': 0, '5': 1})
+
+    assert auth_client.delete(f"/api/reviews/{second['id']}").status_code == 200
+    assert ratings(auth_client, pokemon_id) == (0, None, {'1': 0, '2': 0, '3': 0, '4': 0, '5': 0})